@@ -2,20 +2,56 @@
 
 This module provides the agent execution engine that allows AI to use tools
 iteratively to accomplish complex tasks.
+
+Exports are resolved lazily on first attribute access, so importing ``agent``
+for one name does not load the engine and provider modules as well.
 """
 
-from .engine import AgentEngine, AgentResult
-from .state import AgentState, Message, TodoState
-from .providers import ToolCallingProvider, OpenAIToolCallingProvider, MockToolCallingProvider, AgentResponse
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS: dict[str, str] = {
+    "AgentEngine": ".engine",
+    "AgentResult": ".engine",
+    "run_many": ".engine",
+    "AgentState": ".state",
+    "Message": ".state",
+    "TodoState": ".state",
+    "ToolCallingProvider": ".providers",
+    "OpenAIToolCallingProvider": ".providers",
+    "AsyncOpenAIToolCallingProvider": ".providers",
+    "MockToolCallingProvider": ".providers",
+    "AgentResponse": ".providers",
+    "ResponseCache": ".cache",
+}
 
 __all__ = [
     "AgentEngine",
-    "AgentResult", 
+    "AgentResult",
+    "run_many",
     "AgentState",
     "Message",
     "TodoState",
     "ToolCallingProvider",
     "OpenAIToolCallingProvider",
+    "AsyncOpenAIToolCallingProvider",
     "MockToolCallingProvider",
     "AgentResponse",
+    "ResponseCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,158 @@
+"""Response cache for LLM providers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Errors from unpickling an entry written by another version of the code
+_STALE_ENTRY_ERRORS = (pickle.UnpicklingError, AttributeError, ImportError, EOFError, TypeError)
+
+
+class ResponseCache:
+    """Bounded cache of provider responses keyed on the exact API request.
+    
+    Two requests share an entry only if model, messages, tools and sampling
+    parameters are all identical. Entries expire after `ttl` seconds. In
+    memory at most `maxsize` responses are kept in LRU order. With a `path`,
+    entries are also persisted to a SQLite file, capped at the `maxsize`
+    newest entries, so repeated CLI runs can reuse them; stored responses
+    must therefore be picklable. An unreadable file or entry is a miss.
+    """
+    
+    def __init__(self, maxsize: int = 512, path: Optional[Path] = None, ttl: float = 7 * 24 * 3600):
+        """Initialize ResponseCache.
+        
+        Args:
+            maxsize: Maximum number of responses kept, in memory and on disk each
+            path: SQLite file for persisting responses across runs (memory only if None)
+            ttl: Seconds after which an entry is no longer returned
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (time stored, response)
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        # Sync providers may be driven from several threads (see AgentEngine.arun)
+        self._lock = threading.Lock()
+        self._last_tools: Optional[Tuple[List[Dict[str, Any]], str]] = None
+    
+    def key(self, api_params: Dict[str, Any]) -> str:
+        """Hash the request parameters into a cache key.
+        
+        Args:
+            api_params: Keyword arguments for `chat.completions.create`
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        params = dict(api_params)
+        params["tools"] = self._tools_digest(params.get("tools"))
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+    
+    def _tools_digest(self, tools: Optional[List[Dict[str, Any]]]) -> Optional[str]:
+        """Digest of the tool schemas, encoded once per schema list.
+        
+        The engine passes the same list object on every iteration of a run,
+        so only a new list is serialized again.
+        """
+        if not tools:
+            return None
+        last = self._last_tools
+        if last is not None and last[0] is tools:
+            return last[1]
+        payload = json.dumps(tools, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+        # Holding the list keeps its id from being reused by another object
+        self._last_tools = (tools, digest)
+        return digest
+    
+    def get(self, key: str) -> Any:
+        """Return the cached response for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.path is not None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, *entry)
+            
+            if entry is None or entry[0] < time.time() - self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: str, response: Any) -> None:
+        """Store a response; callers drop raw API objects from it first."""
+        with self._lock:
+            stored_at = time.time()
+            self._remember(key, stored_at, response)
+            if self.path is not None:
+                self._store(key, stored_at, response)
+    
+    def _remember(self, key: str, stored_at: float, response: Any) -> None:
+        self._entries[key] = (stored_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Read an entry from disk; anything unreadable counts as missing."""
+        try:
+            # Read-only so a lookup never creates the file
+            with closing(sqlite3.connect(f"{self.path.absolute().as_uri()}?mode=ro", uri=True)) as db:
+                row = db.execute(
+                    "SELECT stored_at, response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            # Nothing has been persisted yet, or the file is not a cache
+            return None
+        if row is None:
+            return None
+        try:
+            return row[0], pickle.loads(row[1])
+        except _STALE_ENTRY_ERRORS:
+            return None
+    
+    def _store(self, key: str, stored_at: float, response: Any) -> None:
+        """Write an entry to disk, dropping expired and surplus entries."""
+        payload = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Responses may quote project files; keep them private to the user
+            os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o600))
+            with closing(sqlite3.connect(self.path)) as db, db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, response BLOB NOT NULL)"
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, stored_at, payload)
+                )
+                db.execute("DELETE FROM responses WHERE stored_at < ?", (stored_at - self.ttl,))
+                db.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                    (self.maxsize,),
+                )
+        except (OSError, sqlite3.Error):
+            # Persisting is best effort; the in-memory entry still serves this run
+            pass
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .state import AgentState, Message
 from .providers import ToolCallingProvider, AgentResponse
-from tools.base import ToolRegistry, ToolResult
+from tools.base import Tool, ToolRegistry, ToolResult
 
+# Role markers used by AgentEngine.get_conversation_summary
+_ROLE_EMOJI = {"user": "👤", "assistant": "🤖", "tool": "🔧"}
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentResult:
     """Final result from agent execution."""
     success: bool
@@ -48,7 +52,8 @@ class AgentEngine:
                  tool_registry: ToolRegistry,
                  state: Optional[AgentState] = None,
                  max_iterations: int = 15,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 on_iteration: Optional[Callable[[AgentState], None]] = None):
         """Initialize AgentEngine.
         
         Args:
@@ -57,12 +62,14 @@ class AgentEngine:
             state: Agent state (created if None)
             max_iterations: Maximum iterations before stopping
             verbose: Whether to print detailed execution info
+            on_iteration: Called with the state after each iteration completes
         """
         self.provider = provider
         self.tools = tool_registry
         self.state = state or AgentState()
         self.max_iterations = max_iterations
         self.verbose = verbose
+        self.on_iteration = on_iteration
     
     def run(self, initial_prompt: str) -> AgentResult:
         """Main agent execution loop.
@@ -74,93 +81,186 @@ class AgentEngine:
             AgentResult with execution outcome and final state
         """
         try:
-            # Add initial user message
-            self.state.add_user_message(initial_prompt)
-            
-            # Get available tools
-            tool_schemas = self.tools.get_function_schemas()
-            
-            if self.verbose:
-                print(f"🤖 Starting agent with {len(tool_schemas)} tools available")
-                print(f"📊 Max iterations: {self.max_iterations}")
-                tool_names = [tool["function"]["name"] for tool in tool_schemas]
-                print(f"🔧 Tools: {', '.join(tool_names)}")
-                print(f"🎯 Initial prompt: {initial_prompt[:100]}...")
-                print()
+            tool_schemas = self._start(initial_prompt)
             
             # Main execution loop
-            while (self.state.iteration_count < self.max_iterations and 
-                   self.state.should_continue):
-                
-                self.state.increment_iteration()
-                
-                if self.verbose:
-                    print(f"🔄 Iteration {self.state.iteration_count}")
-                
+            while self._begin_iteration():
                 # Get response from LLM
                 response = self.provider.generate_with_tools(
                     messages=self.state.messages,
                     tools=tool_schemas,
                     max_tool_calls=5
                 )
-                
-                if self.verbose:
-                    print(f"💭 LLM Response: {response.message[:150]}...")
-                    if response.tool_calls:
-                        print(f"🔧 Tool calls requested: {len(response.tool_calls)}")
-                
-                # Add assistant message
-                self.state.add_assistant_message(
-                    response.message, 
-                    response.tool_calls if response.tool_calls else None
-                )
+                self._record_response(response)
                 
                 # Execute tool calls if any
+                tools_ok = True
                 if response.has_tool_calls():
-                    success = self._execute_tool_calls(response.tool_calls)
-                    if not success:
-                        if self.verbose:
-                            print("❌ Tool execution failed, stopping agent")
-                        break
-                else:
-                    # No tool calls, update continue flag based on response
-                    self.state.should_continue = response.should_continue
-                    if self.verbose and not response.should_continue:
-                        print("✅ Agent indicated completion")
-                
-                # Safety check for max iterations
-                if self.state.iteration_count >= self.max_iterations:
-                    if self.verbose:
-                        print(f"⏰ Max iterations ({self.max_iterations}) reached")
-                    self.state.stop_execution("max_iterations_reached")
+                    tools_ok = self._execute_tool_calls(response.tool_calls)
+                if not self._end_iteration(response, tools_ok):
                     break
             
-            # Extract final output
-            final_output = self._extract_final_output()
+            return self._finish()
             
-            if self.verbose:
-                print(f"🏁 Agent execution complete")
-                print(f"📈 Final result: {len(final_output)} output fields")
+        except Exception as e:
+            return self._fail(e)
+    
+    async def arun(self, initial_prompt: str) -> AgentResult:
+        """Async agent execution loop; awaits the provider instead of blocking.
+        
+        Tool calls from one response run concurrently where their declared
+        resources allow it. With a provider that streams tool calls, each
+        call starts as soon as its arguments are complete, while the rest of
+        the response is still being generated.
+        
+        Args:
+            initial_prompt: Initial prompt to start the agent
             
-            return AgentResult(
-                success=True,
-                final_output=final_output,
-                state=self.state,
-                iterations_used=self.state.iteration_count
-            )
+        Returns:
+            AgentResult with execution outcome and final state
+        """
+        try:
+            tool_schemas = self._start(initial_prompt)
+            
+            while self._begin_iteration():
+                pipeline = _ToolCallPipeline(self)
+                streaming = {"on_tool_call": pipeline.submit} if self.provider.streams_tool_calls else {}
+                try:
+                    response = await self.provider.agenerate_with_tools(
+                        messages=self.state.messages,
+                        tools=tool_schemas,
+                        max_tool_calls=5,
+                        **streaming
+                    )
+                except Exception:
+                    await self._arecord_interrupted_calls(pipeline, [])
+                    raise
+                finally:
+                    # Calls started mid-stream must settle even if the response failed
+                    await pipeline.settle()
+                await self._arecord_interrupted_calls(pipeline, response.tool_calls)
+                self._record_response(response)
+                
+                tools_ok = True
+                if response.has_tool_calls():
+                    tools_ok = await self._aexecute_tool_calls(response.tool_calls, pipeline)
+                if not self._end_iteration(response, tools_ok):
+                    break
+            
+            return self._finish()
             
         except Exception as e:
-            error_msg = f"Agent execution failed: {str(e)}"
-            if self.verbose:
-                print(f"💥 {error_msg}")
+            return self._fail(e)
+    
+    def _start(self, initial_prompt: str) -> List[Dict[str, Any]]:
+        """Seed the conversation and return the tool schemas offered to the LLM."""
+        # Add initial user message
+        self.state.add_user_message(initial_prompt)
+        
+        # Get available tools
+        tool_schemas = self.tools.get_function_schemas()
+        
+        if self.verbose:
+            print(f"🤖 Starting agent with {len(tool_schemas)} tools available")
+            print(f"📊 Max iterations: {self.max_iterations}")
+            tool_names = [tool["function"]["name"] for tool in tool_schemas]
+            print(f"🔧 Tools: {', '.join(tool_names)}")
+            print(f"🎯 Initial prompt: {initial_prompt[:100]}...")
+            print()
+        
+        return tool_schemas
+    
+    def _begin_iteration(self) -> bool:
+        """Start the next iteration, or return False if the agent is done."""
+        if (self.state.iteration_count >= self.max_iterations or
+                not self.state.should_continue):
+            return False
+        
+        self.state.increment_iteration()
+        
+        if self.verbose:
+            print(f"🔄 Iteration {self.state.iteration_count}")
+        return True
+    
+    def _record_response(self, response: AgentResponse) -> None:
+        """Add an LLM response to the conversation.
+        
+        Args:
+            response: Response returned by the provider
+        """
+        if self.verbose:
+            print(f"💭 LLM Response: {response.message[:150]}...")
+            if response.tool_calls:
+                print(f"🔧 Tool calls requested: {len(response.tool_calls)}")
+        
+        # Add assistant message
+        self.state.add_assistant_message(
+            response.message, 
+            response.tool_calls if response.tool_calls else None
+        )
+    
+    def _end_iteration(self, response: AgentResponse, tools_ok: bool) -> bool:
+        """Finish an iteration once its tool calls have run.
+        
+        Args:
+            response: Response handled in this iteration
+            tools_ok: Whether the response's tool calls executed successfully
             
-            return AgentResult(
-                success=False,
-                final_output={},
-                state=self.state,
-                iterations_used=self.state.iteration_count,
-                error=error_msg
-            )
+        Returns:
+            True to keep iterating, False to stop the loop
+        """
+        if response.has_tool_calls():
+            if not tools_ok:
+                if self.verbose:
+                    print("❌ Tool execution failed, stopping agent")
+                return False
+        else:
+            # No tool calls, update continue flag based on response
+            self.state.should_continue = response.should_continue
+            if self.verbose and not response.should_continue:
+                print("✅ Agent indicated completion")
+        
+        # Report progress before the next LLM round-trip
+        if self.on_iteration:
+            self.on_iteration(self.state)
+        
+        # Safety check for max iterations
+        if self.state.iteration_count >= self.max_iterations:
+            if self.verbose:
+                print(f"⏰ Max iterations ({self.max_iterations}) reached")
+            self.state.stop_execution("max_iterations_reached")
+            return False
+        return True
+    
+    def _finish(self) -> AgentResult:
+        """Build the successful result once the loop has ended."""
+        # Extract final output
+        final_output = self._extract_final_output()
+        
+        if self.verbose:
+            print(f"🏁 Agent execution complete")
+            print(f"📈 Final result: {len(final_output)} output fields")
+        
+        return AgentResult(
+            success=True,
+            final_output=final_output,
+            state=self.state,
+            iterations_used=self.state.iteration_count
+        )
+    
+    def _fail(self, error: Exception) -> AgentResult:
+        """Build the failed result for an exception raised during the run."""
+        error_msg = f"Agent execution failed: {str(error)}"
+        if self.verbose:
+            print(f"💥 {error_msg}")
+        
+        return AgentResult(
+            success=False,
+            final_output={},
+            state=self.state,
+            iterations_used=self.state.iteration_count,
+            error=error_msg
+        )
     
     def _execute_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> bool:
         """Execute tool calls and add results to conversation.
@@ -172,52 +272,124 @@ class AgentEngine:
             True if all tool calls succeeded, False if any failed critically
         """
         for tool_call in tool_calls:
+            self._record_tool_call(tool_call, *self._run_tool_call(tool_call))
+        
+        return True  # Continue execution even if some tools fail
+    
+    async def _aexecute_tool_calls(self,
+                                   tool_calls: List[Dict[str, Any]],
+                                   pipeline: Optional[_ToolCallPipeline] = None) -> bool:
+        """Execute tool calls concurrently where they don't conflict.
+        
+        Results are added to the conversation in the order the LLM emitted
+        the calls, regardless of which finished first.
+        
+        Args:
+            tool_calls: List of tool calls from LLM response
+            pipeline: Pipeline that may already be running some of the calls
+            
+        Returns:
+            True if all tool calls succeeded, False if any failed critically
+        """
+        pipeline = pipeline or _ToolCallPipeline(self)
+        for tool_call in tool_calls:
+            pipeline.submit(tool_call)
+        
+        outcomes = await pipeline.results(tool_calls)
+        for tool_call, outcome in zip(tool_calls, outcomes):
+            self._record_tool_call(tool_call, *outcome)
+        
+        return True  # Continue execution even if some tools fail
+    
+    async def _arecord_interrupted_calls(self,
+                                         pipeline: _ToolCallPipeline,
+                                         reported: List[Dict[str, Any]]) -> None:
+        """Record calls that ran mid-stream but are missing from the response.
+        
+        A stream can fail after some of its tool calls already ran, and may
+        have written files. Their outcomes are added to the conversation,
+        after an assistant message that carries the calls, so the state
+        matches what actually happened.
+        
+        Args:
+            pipeline: Pipeline the streamed calls were submitted to
+            reported: Tool calls in the response the provider returned
+        """
+        interrupted = pipeline.unreported(reported)
+        if not interrupted:
+            return
+        
+        outcomes = await pipeline.results(interrupted)
+        self.state.add_assistant_message("", interrupted)
+        for tool_call, outcome in zip(interrupted, outcomes):
+            self._record_tool_call(tool_call, *outcome)
+    
+    def _run_tool_call(self, tool_call: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Execute a single tool call without touching the agent state.
+        
+        Safe to run from a worker thread; `_record_tool_call` applies the outcome.
+        
+        Args:
+            tool_call: Tool call from LLM response
+            
+        Returns:
+            Tuple of (message content for the LLM, file explored by the call if any)
+        """
+        try:
+            # Parse tool call
+            function_name = tool_call["function"]["name"]
+            arguments_str = tool_call["function"]["arguments"]
+            
+            # Parse arguments
             try:
-                # Parse tool call
-                function_name = tool_call["function"]["name"]
-                arguments_str = tool_call["function"]["arguments"]
-                tool_call_id = tool_call["id"]
-                
-                # Parse arguments
-                try:
-                    arguments = json.loads(arguments_str)
-                except json.JSONDecodeError as e:
-                    error_msg = f"Invalid JSON arguments for {function_name}: {str(e)}"
-                    self.state.add_tool_message(error_msg, tool_call_id)
-                    if self.verbose:
-                        print(f"❌ JSON error: {error_msg}")
-                    continue
-                
+                arguments = json.loads(arguments_str)
+            except json.JSONDecodeError as e:
+                error_msg = f"Invalid JSON arguments for {function_name}: {str(e)}"
                 if self.verbose:
-                    print(f"🔧 Executing: {function_name}({self._format_args(arguments)})")
-                
-                # Execute tool
-                result = self.tools.execute_tool(function_name, **arguments)
-                
-                # Track file exploration for read_file tool
-                if function_name == "read_file" and result.success:
-                    if "path" in arguments:
-                        from pathlib import Path
-                        self.state.add_explored_file(Path(arguments["path"]))
-                
-                # Format result for LLM
-                result_content = self._format_tool_result(result, function_name)
-                
-                # Add tool result message
-                self.state.add_tool_message(result_content, tool_call_id)
-                
-                if self.verbose:
-                    status = "✅" if result.success else "❌"
-                    print(f"{status} Tool result: {result_content[:100]}...")
-                
-            except Exception as e:
-                error_content = f"Tool execution failed: {str(e)}"
-                self.state.add_tool_message(error_content, tool_call.get("id", "unknown"))
-                
-                if self.verbose:
-                    print(f"💥 Tool error: {error_content}")
+                    print(f"❌ JSON error: {error_msg}")
+                return error_msg, None
+            
+            if self.verbose:
+                print(f"🔧 Executing: {function_name}({self._format_args(arguments)})")
+            
+            # Execute tool
+            result = self.tools.execute_tool(function_name, **arguments)
+            
+            # Track file exploration for read_file tool
+            explored = None
+            if function_name == "read_file" and result.success:
+                if "path" in arguments:
+                    explored = str(arguments["path"])
+            
+            # Format result for LLM
+            result_content = self._format_tool_result(result, function_name)
+            
+            if self.verbose:
+                status = "✅" if result.success else "❌"
+                print(f"{status} Tool result: {result_content[:100]}...")
+            
+            return result_content, explored
+            
+        except Exception as e:
+            error_content = f"Tool execution failed: {str(e)}"
+            
+            if self.verbose:
+                print(f"💥 Tool error: {error_content}")
+            return error_content, None
+    
+    def _record_tool_call(self, tool_call: Dict[str, Any], content: str, explored: Optional[str]) -> None:
+        """Apply the outcome of a tool call to the agent state.
         
-        return True  # Continue execution even if some tools fail
+        Args:
+            tool_call: Tool call from LLM response
+            content: Message content for the LLM
+            explored: File explored by the call, if any
+        """
+        if explored is not None:
+            self.state.add_explored_file(explored)
+        
+        # Add tool result message
+        self.state.add_tool_message(content, tool_call.get("id", "unknown"))
     
     def _format_args(self, args: Dict[str, Any]) -> str:
         """Format arguments for display.
@@ -253,7 +425,9 @@ class AgentEngine:
             if result.data:
                 # Handle different data types appropriately
                 if isinstance(result.data, dict):
-                    return json.dumps(result.data, indent=2)
+                    # Compact and unescaped: the model doesn't need pretty-printing,
+                    # and indentation/\u escapes only add bytes and tokens
+                    return json.dumps(result.data, separators=(",", ":"), ensure_ascii=False)
                 elif isinstance(result.data, str):
                     return result.data
                 else:
@@ -278,7 +452,7 @@ class AgentEngine:
             "iterations_used": self.state.iteration_count,
             "conversation_length": len(self.state.messages),
             "exploration_summary": self.state.get_exploration_summary(),
-            "files_explored": [str(p) for p in self.state.files_explored]
+            "files_explored": list(self.state.files_explored)
         }
         
         # Add use-case specific output
@@ -299,12 +473,12 @@ class AgentEngine:
         """
         summary_lines = []
         
-        for i, message in enumerate(self.state.messages):
-            role_emoji = {"user": "👤", "assistant": "🤖", "tool": "🔧"}
-            emoji = role_emoji.get(message.role, "❓")
+        for i, message in enumerate(self.state.messages, 1):
+            emoji = _ROLE_EMOJI.get(message.role, "❓")
             
-            content_preview = message.content[:80] + "..." if len(message.content) > 80 else message.content
-            summary_lines.append(f"{i+1:2d}. {emoji} {message.role}: {content_preview}")
+            content = message.content
+            ellipsis = "..." if len(content) > 80 else ""
+            summary_lines.append(f"{i:2d}. {emoji} {message.role}: {content[:80]}{ellipsis}")
             
             if message.tool_calls:
                 for tc in message.tool_calls:
@@ -312,3 +486,77 @@ class AgentEngine:
                     summary_lines.append(f"    └─ Tool call: {tool_name}")
         
         return "\n".join(summary_lines)
+
+
+class _ToolCallPipeline:
+    """Runs the tool calls of one LLM response as they become available.
+    
+    Each submitted call starts right away in a worker thread, after waiting
+    only for earlier calls whose tools conflict with its own (see
+    `Tool.conflicts_with`), so conflicting calls keep the order the LLM
+    emitted them in.
+    """
+    
+    def __init__(self, engine: AgentEngine):
+        self._engine = engine
+        self._started: List[Tuple[Dict[str, Any], Optional[Tool], asyncio.Task]] = []
+    
+    def submit(self, tool_call: Dict[str, Any]) -> None:
+        """Start a tool call unless it is already running.
+        
+        Args:
+            tool_call: Tool call from LLM response
+        """
+        if any(started is tool_call for started, _, _ in self._started):
+            return
+        
+        # Unknown tools and malformed calls only produce an error message
+        tool = self._engine.tools.get_tool(tool_call.get("function", {}).get("name", ""))
+        blockers = [
+            task for _, other, task in self._started
+            if tool is not None and other is not None and tool.conflicts_with(other)
+        ]
+        task = asyncio.ensure_future(self._run(tool_call, blockers))
+        self._started.append((tool_call, tool, task))
+    
+    async def _run(self, tool_call: Dict[str, Any], blockers: List[asyncio.Task]) -> Tuple[str, Optional[str]]:
+        if blockers:
+            await asyncio.wait(blockers)
+        return await asyncio.to_thread(self._engine._run_tool_call, tool_call)
+    
+    async def results(self, tool_calls: List[Dict[str, Any]]) -> List[Tuple[str, Optional[str]]]:
+        """Wait for the given calls and return their outcomes in the same order."""
+        tasks = {id(started): task for started, _, task in self._started}
+        return list(await asyncio.gather(*(tasks[id(tool_call)] for tool_call in tool_calls)))
+    
+    def unreported(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Started calls that are not among `tool_calls`, in submission order."""
+        reported = {id(tool_call) for tool_call in tool_calls}
+        return [started for started, _, _ in self._started if id(started) not in reported]
+    
+    async def settle(self) -> None:
+        """Wait for every started call, so none outlives its iteration."""
+        if self._started:
+            await asyncio.wait([task for _, _, task in self._started])
+
+
+async def run_many(make_engine: Callable[[], AgentEngine],
+                   prompts: List[str],
+                   max_concurrency: int = 5) -> List[AgentResult]:
+    """Run one agent per prompt concurrently.
+    
+    Args:
+        make_engine: Factory returning a fresh engine (each run needs its own state)
+        prompts: Initial prompts, one per agent
+        max_concurrency: Maximum agents in flight at once, to stay within rate limits
+        
+    Returns:
+        Results in the same order as `prompts`
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_one(prompt: str) -> AgentResult:
+        async with semaphore:
+            return await make_engine().arun(prompt)
+    
+    return list(await asyncio.gather(*(run_one(prompt) for prompt in prompts)))
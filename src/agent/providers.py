@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .state import Message
 
+if TYPE_CHECKING:
+    from .cache import ResponseCache
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentResponse:
     """Response from LLM with potential tool calls."""
     message: str
@@ -26,6 +31,10 @@ class AgentResponse:
 class ToolCallingProvider:
     """Extended provider interface that supports tool/function calling."""
     
+    # Whether agenerate_with_tools accepts `on_tool_call` and reports each tool
+    # call as soon as it is complete, before the whole response has arrived
+    streams_tool_calls: bool = False
+    
     def generate_with_tools(self, 
                           messages: List[Message],
                           tools: List[Dict[str, Any]],
@@ -41,17 +50,52 @@ class ToolCallingProvider:
             AgentResponse with message and potential tool calls
         """
         raise NotImplementedError
+    
+    async def agenerate_with_tools(self, 
+                                   messages: List[Message],
+                                   tools: List[Dict[str, Any]],
+                                   max_tool_calls: int = 5) -> AgentResponse:
+        """Async variant of `generate_with_tools`.
+        
+        The default runs the blocking call in a worker thread; providers with
+        a native async client should override it.
+        """
+        return await asyncio.to_thread(self.generate_with_tools, messages, tools, max_tool_calls)
 
 
 class OpenAIToolCallingProvider(ToolCallingProvider):
     """OpenAI provider with function calling support."""
     
-    def __init__(self, client=None, model: str = "gpt-4o"):
+    # Plain substring matches, case-insensitive; each pattern scans the response once
+    _STOP_SIGNALS_RE = re.compile(
+        "|".join(map(re.escape, [
+            "task completed",
+            "analysis complete",
+            "plan finished",
+            "done",
+            "finished",
+            "complete",
+        ])),
+        re.IGNORECASE,
+    )
+    _CONTINUE_SIGNALS_RE = re.compile(
+        "|".join(map(re.escape, [
+            "let me",
+            "i'll",
+            "next",
+            "now i",
+            "continue",
+        ])),
+        re.IGNORECASE,
+    )
+    
+    def __init__(self, client=None, model: str = "gpt-4o", cache: Optional[ResponseCache] = None):
         """Initialize OpenAI tool calling provider.
         
         Args:
             client: OpenAI client instance (created if None)
             model: Model to use for generation
+            cache: Cache for replaying responses to identical requests (disabled if None)
         """
         if client is None:
             from openai import OpenAI
@@ -59,6 +103,7 @@ class OpenAIToolCallingProvider(ToolCallingProvider):
         
         self.client = client
         self.model = model
+        self.cache = cache
     
     def generate_with_tools(self, 
                           messages: List[Message],
@@ -74,6 +119,36 @@ class OpenAIToolCallingProvider(ToolCallingProvider):
         Returns:
             AgentResponse with message content and tool calls
         """
+        api_params = self._build_request(messages, tools)
+        
+        cache_key = self.cache.key(api_params) if self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            # Make API call
+            response = self.client.chat.completions.create(**api_params)
+            agent_response = self._parse_response(response)
+        except Exception as e:
+            # Errors are never cached so a retry reaches the API again
+            return self._error_response(e)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, replace(agent_response, raw_response=None))
+        return agent_response
+    
+    def _build_request(self, messages: List[Message], tools: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build chat completion parameters for a conversation.
+        
+        Args:
+            messages: Conversation history as Message objects
+            tools: Available tools as function schemas
+            
+        Returns:
+            Keyword arguments for `chat.completions.create`
+        """
         # Convert messages to OpenAI format
         openai_messages = self._convert_messages_to_openai(messages)
         
@@ -90,74 +165,66 @@ class OpenAIToolCallingProvider(ToolCallingProvider):
             api_params["tools"] = tools
             api_params["tool_choice"] = "auto"
         
-        try:
-            # Make API call
-            response = self.client.chat.completions.create(**api_params)
-            
-            message = response.choices[0].message
-            
-            # Extract message content
-            content = message.content or ""
-            
-            # Extract tool calls if any
-            tool_calls = []
-            if message.tool_calls:
-                for tc in message.tool_calls:
-                    tool_calls.append({
-                        "id": tc.id,
-                        "type": tc.type,
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    })
-            
-            # Determine if should continue
-            should_continue = self._should_continue_based_on_response(content, tool_calls)
-            
-            return AgentResponse(
-                message=content,
-                tool_calls=tool_calls,
-                should_continue=should_continue,
-                raw_response=response
-            )
+        return api_params
+    
+    def _parse_response(self, response: Any) -> AgentResponse:
+        """Convert a chat completion into an AgentResponse.
+        
+        Args:
+            response: Chat completion returned by the OpenAI client
             
-        except Exception as e:
-            # Return error response
-            return AgentResponse(
-                message=f"Error: {str(e)}",
-                tool_calls=[],
-                should_continue=False
-            )
+        Returns:
+            AgentResponse with message content and tool calls
+        """
+        message = response.choices[0].message
+        
+        # Extract message content
+        content = message.content or ""
+        
+        # Extract tool calls if any
+        tool_calls = [
+            {
+                "id": tc.id,
+                "type": tc.type,
+                "function": {
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments
+                }
+            }
+            for tc in message.tool_calls or []
+        ]
+        
+        # Determine if should continue
+        should_continue = self._should_continue_based_on_response(content, tool_calls)
+        
+        return AgentResponse(
+            message=content,
+            tool_calls=tool_calls,
+            should_continue=should_continue,
+            raw_response=response
+        )
+    
+    def _error_response(self, error: Exception) -> AgentResponse:
+        """Turn a failed API call into a terminal AgentResponse."""
+        return AgentResponse(
+            message=f"Error: {str(error)}",
+            tool_calls=[],
+            should_continue=False
+        )
     
     def _convert_messages_to_openai(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """Convert Message objects to OpenAI API format.
         
+        Each message converts itself once (see `Message.to_dict`), so a turn
+        only builds the list rather than re-converting the whole history.
+        
         Args:
             messages: List of Message objects
             
         Returns:
             List of dictionaries in OpenAI message format
         """
-        openai_messages = []
-        
-        for msg in messages:
-            openai_msg = {
-                "role": msg.role,
-                "content": msg.content
-            }
-            
-            # Add tool calls if present
-            if msg.tool_calls:
-                openai_msg["tool_calls"] = msg.tool_calls
-            
-            # Add tool call ID if this is a tool response
-            if msg.tool_call_id:
-                openai_msg["tool_call_id"] = msg.tool_call_id
-            
-            openai_messages.append(openai_msg)
-        
-        return openai_messages
+        return [msg.to_dict() for msg in messages]
     
     def _should_continue_based_on_response(self, content: str, tool_calls: List[Dict]) -> bool:
         """Determine if agent should continue based on response.
@@ -173,38 +240,154 @@ class OpenAIToolCallingProvider(ToolCallingProvider):
         if tool_calls:
             return True
         
-        # Check for explicit stop signals in content
-        stop_signals = [
-            "task completed",
-            "analysis complete", 
-            "plan finished",
-            "done",
-            "finished",
-            "complete"
-        ]
-        
-        content_lower = content.lower()
-        for signal in stop_signals:
-            if signal in content_lower:
-                return False
-        
-        # Check for explicit continue signals
-        continue_signals = [
-            "let me",
-            "i'll",
-            "next",
-            "now i",
-            "continue"
-        ]
+        # Explicit stop signals win over continue signals
+        if self._STOP_SIGNALS_RE.search(content):
+            return False
         
-        for signal in continue_signals:
-            if signal in content_lower:
-                return True
+        if self._CONTINUE_SIGNALS_RE.search(content):
+            return True
         
         # Default to stopping if no clear signals
         return False
 
 
+class AsyncOpenAIToolCallingProvider(OpenAIToolCallingProvider):
+    """OpenAI tool calling provider backed by `AsyncOpenAI`.
+    
+    Awaiting requests instead of blocking on them lets several agents share
+    one event loop (see `AgentEngine.arun` and `run_many`). Responses can be
+    streamed so tool calls start before the completion has finished.
+    """
+    
+    streams_tool_calls = True
+    
+    def __init__(self, client=None, model: str = "gpt-4o", cache: Optional[ResponseCache] = None):
+        """Initialize async OpenAI tool calling provider.
+        
+        Args:
+            client: AsyncOpenAI client instance (created if None)
+            model: Model to use for generation
+            cache: Cache for replaying responses to identical requests (disabled if None)
+        """
+        if client is None:
+            from openai import AsyncOpenAI
+            client = AsyncOpenAI()
+        
+        super().__init__(client=client, model=model, cache=cache)
+    
+    def generate_with_tools(self, 
+                          messages: List[Message],
+                          tools: List[Dict[str, Any]],
+                          max_tool_calls: int = 5) -> AgentResponse:
+        """Not supported: the async client can only be awaited."""
+        raise NotImplementedError(
+            "AsyncOpenAIToolCallingProvider is async-only; use agenerate_with_tools or AgentEngine.arun"
+        )
+    
+    async def agenerate_with_tools(self, 
+                                   messages: List[Message],
+                                   tools: List[Dict[str, Any]],
+                                   max_tool_calls: int = 5,
+                                   on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None) -> AgentResponse:
+        """Generate response with tool calling support without blocking the loop.
+        
+        Args:
+            messages: Conversation history as Message objects
+            tools: Available tools as function schemas
+            max_tool_calls: Maximum tool calls (used in prompt guidance)
+            on_tool_call: Called with each tool call as soon as its arguments
+                are complete; enables streaming. The same dicts end up in the
+                returned response.
+            
+        Returns:
+            AgentResponse with message content and tool calls
+        """
+        api_params = self._build_request(messages, tools)
+        
+        cache_key = self.cache.key(api_params) if self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            # Make API call
+            if on_tool_call is None:
+                response = await self.client.chat.completions.create(**api_params)
+                agent_response = self._parse_response(response)
+            else:
+                stream = await self.client.chat.completions.create(**api_params, stream=True)
+                agent_response = await self._consume_stream(stream, on_tool_call)
+        except Exception as e:
+            # Errors are never cached so a retry reaches the API again
+            return self._error_response(e)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, replace(agent_response, raw_response=None))
+        return agent_response
+    
+    async def _consume_stream(self, stream: Any, on_tool_call: Callable[[Dict[str, Any]], None]) -> AgentResponse:
+        """Assemble a streamed completion, reporting tool calls as they complete.
+        
+        Args:
+            stream: Async iterator of chat completion chunks
+            on_tool_call: Called once per tool call when its arguments are complete
+            
+        Returns:
+            AgentResponse with message content and tool calls
+        """
+        content_parts: List[str] = []
+        calls: Dict[int, Dict[str, Any]] = {}
+        reported: set[int] = set()
+        
+        def report(index: int) -> None:
+            if index not in reported:
+                reported.add(index)
+                on_tool_call(calls[index])
+        
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+            
+            for tc in delta.tool_calls or []:
+                call = calls.get(tc.index)
+                if call is None:
+                    call = calls[tc.index] = {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {"name": "", "arguments": ""}
+                    }
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function is not None:
+                    call["function"]["name"] += tc.function.name or ""
+                    call["function"]["arguments"] += tc.function.arguments or ""
+                
+                # An object that parses after its closing brace can't grow further
+                arguments = call["function"]["arguments"]
+                if arguments.rstrip().endswith("}") and tc.index not in reported:
+                    try:
+                        json.loads(arguments)
+                    except json.JSONDecodeError:
+                        continue
+                    report(tc.index)
+        
+        # Report anything the stream ended on without a parseable object
+        tool_calls = [calls[index] for index in sorted(calls)]
+        for index in sorted(calls):
+            report(index)
+        
+        content = "".join(content_parts)
+        return AgentResponse(
+            message=content,
+            tool_calls=tool_calls,
+            should_continue=self._should_continue_based_on_response(content, tool_calls)
+        )
+
+
 class MockToolCallingProvider(ToolCallingProvider):
     """Mock provider for testing agent flows."""
     
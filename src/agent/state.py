@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from tools.todo import TodoList
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a message in the agent conversation."""
     role: str  # "user", "assistant", "tool"
     content: str
     tool_calls: Optional[List[Dict[str, Any]]] = None
     tool_call_id: Optional[str] = None
+    # API form, built once: messages are not edited after being added
+    _api_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API calls."""
+        """Convert to dictionary for API calls.
+        
+        The dictionary is cached and shared between calls, so callers must
+        not modify it.
+        """
+        if self._api_dict is not None:
+            return self._api_dict
+        
         result = {
             "role": self.role,
             "content": self.content
@@ -30,10 +40,11 @@ class Message:
         if self.tool_call_id:
             result["tool_call_id"] = self.tool_call_id
         
+        self._api_dict = result
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoState:
     """State related to todo management."""
     todo_list: TodoList = field(default_factory=TodoList)
@@ -47,7 +58,7 @@ class TodoState:
         return self.todo_list.get_stats()
 
 
-@dataclass  
+@dataclass(slots=True)
 class AgentState:
     """Maintains state during agent execution."""
     
@@ -55,7 +66,7 @@ class AgentState:
     messages: List[Message] = field(default_factory=list)
     
     # Execution tracking
-    files_explored: set[Path] = field(default_factory=set)
+    files_explored: set[str] = field(default_factory=set)
     current_focus: Optional[str] = None
     iteration_count: int = 0
     should_continue: bool = True
@@ -66,8 +77,13 @@ class AgentState:
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Index of the newest assistant message, maintained by add_message
+    _last_assistant_idx: int = field(default=-1, init=False, repr=False, compare=False)
+    
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation history."""
+        if message.role == "assistant":
+            self._last_assistant_idx = len(self.messages)
         self.messages.append(message)
     
     def add_user_message(self, content: str) -> None:
@@ -88,14 +104,19 @@ class AgentState:
     
     def get_last_assistant_message(self) -> Optional[Message]:
         """Get the most recent assistant message."""
+        idx = self._last_assistant_idx
+        if 0 <= idx < len(self.messages) and self.messages[idx].role == "assistant":
+            return self.messages[idx]
+        
+        # Fall back to a scan if the list was modified outside add_message
         for message in reversed(self.messages):
             if message.role == "assistant":
                 return message
         return None
     
-    def add_explored_file(self, file_path: Path) -> None:
-        """Track a file that was explored."""
-        self.files_explored.add(file_path)
+    def add_explored_file(self, file_path: str | os.PathLike[str]) -> None:
+        """Track a file that was explored, stored as the path string the tool was given."""
+        self.files_explored.add(sys.intern(os.fspath(file_path)))
     
     def get_exploration_summary(self) -> str:
         """Get summary of exploration activity."""
@@ -0,0 +1,7 @@
+"""Optional background daemon that keeps the CLI warm between invocations.
+
+``ai daemon start`` launches a Unix-socket server that has already imported
+the command modules and holds a pooled OpenAI client. While it is running,
+``ai`` forwards its argv, working directory and environment to the daemon and
+streams the output back instead of starting up in-process.
+"""
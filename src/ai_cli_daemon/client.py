@@ -0,0 +1,73 @@
+"""Thin client that hands an ``ai`` invocation over to a running daemon."""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from ai_cli_daemon.protocol import NO_DAEMON_ENV, decode, encode, socket_path
+
+
+def _connect(path: Path) -> socket.socket | None:
+    """Connect to the daemon socket, or return None if no daemon is listening."""
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        # Stale socket file left behind by a daemon that died
+        sock.close()
+        return None
+    return sock
+
+
+def forward(argv: list[str], path: Path | None = None) -> int | None:
+    """Run ``argv`` in the daemon, streaming its output to our stdout/stderr.
+
+    Returns the command's exit code, or None when no daemon is available and
+    the caller should run the command in-process.
+    """
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+
+    env = dict(os.environ)
+    # The daemon writes to a pipe; let Rich keep colors and width of our terminal
+    if sys.stdout.isatty():
+        env.setdefault("FORCE_COLOR", "1")
+        env.setdefault("COLUMNS", str(os.get_terminal_size(sys.stdout.fileno()).columns))
+
+    with sock, sock.makefile("rb") as replies:
+        sock.sendall(encode({"argv": argv, "cwd": os.getcwd(), "env": env}))
+        for line in replies:
+            message = decode(line)
+            if "stdout" in message:
+                sys.stdout.write(message["stdout"])
+                sys.stdout.flush()
+            elif "stderr" in message:
+                sys.stderr.write(message["stderr"])
+                sys.stderr.flush()
+            elif "readline" in message:
+                # The command is prompting; answer from our own stdin
+                sock.sendall(encode({"stdin": sys.stdin.readline()}))
+            elif "exit_code" in message:
+                return message["exit_code"]
+    # Connection dropped before the command finished
+    return 1
+
+
+def control(command: str, path: Path | None = None) -> dict[str, Any] | None:
+    """Send a control request ("status" or "stop"); None if no daemon is running."""
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+    with sock, sock.makefile("rb") as replies:
+        sock.sendall(encode({"control": command}))
+        line = replies.readline()
+    return decode(line) if line else None
@@ -0,0 +1,34 @@
+"""Wire format shared by the daemon server and client.
+
+Each message is one JSON object per line. A client sends a single request,
+either a run request ``{"argv", "cwd", "env"}`` or a control request
+``{"control": "status" | "stop"}``. For a run request the server replies with
+any number of ``{"stdout": ...}`` / ``{"stderr": ...}`` chunks followed by a
+final ``{"exit_code": ...}``; for a control request it replies with one object.
+When the command reads its stdin, the server sends ``{"readline": true}`` and
+the client answers with ``{"stdin": line}``, where ``""`` means end of input.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Set to a non-empty value to always run in-process, even when a daemon is up
+NO_DAEMON_ENV = "AI_CLI_NO_DAEMON"
+
+
+def socket_path() -> Path:
+    """Location of the daemon's Unix socket."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ai-cli" / "sock"
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict[str, Any]:
+    return json.loads(line)
@@ -0,0 +1,215 @@
+"""Unix-socket server that runs ``ai`` invocations inside a warm process.
+
+Requests are executed one at a time: each one temporarily takes over the
+process's working directory, environment and standard streams, so running
+them concurrently would let them trample each other.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable
+
+from ai_cli_daemon.protocol import decode, encode, socket_path
+
+# Modules imported up front so the first forwarded command is already warm
+_PRELOAD = ("llm.openai_provider", "utils.render", "core.context")
+
+
+class _StreamWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as one message."""
+
+    def __init__(self, name: str, send: Callable[[dict[str, Any]], None]) -> None:
+        self._name = name
+        self._send = send
+        self._broken = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        # Click occasionally writes encoded output straight to the stream
+        if isinstance(text, bytes):
+            text = text.decode(errors="replace")
+        if text and not self._broken:
+            try:
+                self._send({self._name: text})
+            except OSError:
+                # Client went away; let the command finish without output
+                self._broken = True
+        return len(text)
+
+
+class _StdinReader(io.TextIOBase):
+    """Text stream that asks the client for each line the command reads."""
+
+    def __init__(self, request_line: Callable[[], str]) -> None:
+        self._request_line = request_line
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int | None = -1) -> str:
+        if self._eof:
+            return ""
+        try:
+            line = self._request_line()
+        except (OSError, ValueError, KeyError):
+            # Client went away or answered garbage; treat as end of input
+            line = ""
+        if not line:
+            self._eof = True
+        return line
+
+    def read(self, size: int | None = -1) -> str:
+        return "".join(iter(self.readline, ""))
+
+
+def run_command(
+    argv: list[str],
+    cwd: str,
+    env: dict[str, str],
+    send: Callable[[dict[str, Any]], None],
+    request_line: Callable[[], str] | None = None,
+) -> int:
+    """Run one CLI invocation in this process and return its exit code.
+
+    `request_line` fetches the next line of the client's stdin ("" at end of
+    input); without it the command sees an empty stdin.
+    """
+    from cli import build_app
+    from cli_commands import runtime
+
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_stdin = sys.stdin
+    stdout = _StreamWriter("stdout", send)
+    stderr = _StreamWriter("stderr", send)
+    try:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        # Prompts (e.g. testwrite's write confirmation) read from the client
+        sys.stdin = _StdinReader(request_line) if request_line else io.StringIO()
+        # Rebuild the console so it picks up this client's terminal settings
+        runtime.reset()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                build_app(argv)(args=argv[1:], prog_name="ai")
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    return e.code or 0
+                print(e.code, file=sys.stderr)
+                return 1
+            except Exception:
+                traceback.print_exc()
+                return 1
+        return 0
+    finally:
+        sys.stdin = saved_stdin
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+class DaemonServer:
+    """Serves run and control requests on a Unix socket until told to stop."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.started = time.time()
+        self.requests = 0
+        self._lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+    async def serve(self) -> None:
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        # Requests carry the caller's environment, API keys included, so the
+        # socket must never exist with looser permissions than 0600
+        saved_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self._handle, path=str(self.path))
+        finally:
+            os.umask(saved_umask)
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+    def _control(self, command: str) -> dict[str, Any]:
+        if command == "status":
+            return {
+                "status": "running",
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started,
+                "requests": self.requests,
+            }
+        if command == "stop":
+            self._stopping.set()
+            return {"status": "stopping", "pid": os.getpid()}
+        return {"error": f"Unknown control command: {command}"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            request = decode(line)
+            if "control" in request:
+                await _send(writer, self._control(request["control"]))
+                return
+
+            loop = asyncio.get_running_loop()
+
+            def send(message: dict[str, Any]) -> None:
+                # Called from the worker thread; block until written for backpressure
+                asyncio.run_coroutine_threadsafe(_send(writer, message), loop).result()
+
+            async def read_client_line() -> str:
+                await _send(writer, {"readline": True})
+                reply = await reader.readline()
+                return decode(reply)["stdin"] if reply else ""
+
+            def request_line() -> str:
+                return asyncio.run_coroutine_threadsafe(read_client_line(), loop).result()
+
+            async with self._lock:
+                exit_code = await loop.run_in_executor(
+                    None, run_command, request["argv"], request["cwd"], request["env"], send, request_line
+                )
+                self.requests += 1
+            await _send(writer, {"exit_code": exit_code})
+        except (ConnectionError, ValueError, KeyError):
+            # Client disconnected or sent a malformed request
+            pass
+        finally:
+            writer.close()
+
+
+async def _send(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    writer.write(encode(message))
+    await writer.drain()
+
+
+def run(path: Path | None = None) -> None:
+    """Preload the CLI and serve requests until a stop request arrives."""
+    from cli import LAZY_COMMANDS
+
+    for module_name in (*_PRELOAD, *(module for module, _ in LAZY_COMMANDS.values())):
+        importlib.import_module(module_name)
+    asyncio.run(DaemonServer(path or socket_path()).serve())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import typer
+
+__version__ = "0.1.0"
+
+# Subcommand name -> (module defining it, short help shown in the command list)
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "ask": ("cli_commands.ask", "Ask questions about your code with AI assistance."),
+    "task": ("cli_commands.task", "Create structured, actionable plans for development tasks."),
+    "agentic-task": (
+        "cli_commands.agentic_task",
+        "AI agent that explores your project and creates comprehensive action plans.",
+    ),
+    "testwrite": ("cli_commands.testwrite", "Generate comprehensive test suites for your code."),
+    "daemon": ("cli_commands.daemon", "Manage the background daemon that keeps the CLI warm."),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the first positional argument, i.e. the requested subcommand."""
+    return next((arg for arg in argv[1:] if not arg.startswith("-")), None)
+
+
+def _command_stub() -> None:
+    """Placeholder for commands that are listed but not invoked."""
+
+
+def build_app(argv: list[str]) -> typer.Typer:
+    """Build the Typer app, importing only the module of the invoked subcommand.
+
+    Commands that are not invoked are registered as stubs carrying just their
+    short help, so ``ai --help`` and unknown-command errors still list them.
+    """
+    import importlib
+
+    import typer
+
+    from cli_commands.root import APP_HELP, main_callback
+
+    app = typer.Typer(add_completion=False, help=APP_HELP)
+    app.callback(invoke_without_command=True)(main_callback)
+
+    requested = _sniff_subcommand(argv)
+    for name, (module_name, short_help) in LAZY_COMMANDS.items():
+        if name == requested:
+            importlib.import_module(module_name).register(app)
+        else:
+            app.command(name=name, help=short_help)(_command_stub)
+    return app
+
+
+def main() -> None:
+    """Entry point for console script."""
+    # Answer version probes before Typer, Click and Rich are imported
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        print(__version__)
+        return
+    # Hand the invocation to a running daemon, if any (never for `ai daemon ...`)
+    if _sniff_subcommand(sys.argv) != "daemon":
+        from ai_cli_daemon.client import forward
+
+        exit_code = forward(sys.argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+    build_app(sys.argv)()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""CLI command modules.
+
+Each module defines one Typer command and a ``register(app)`` hook. The root
+``cli`` module imports only the module for the subcommand being invoked.
+"""
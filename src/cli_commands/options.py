@@ -0,0 +1,25 @@
+"""Typer option defaults shared by the CLI commands."""
+
+from __future__ import annotations
+
+import typer
+
+# Global options for context and behavior control
+ModelOption = typer.Option("gpt-5-mini", "--model", help="AI model to use (gpt-5-nano, gpt-5-mini, gpt-5)")
+MaxFilesOption = typer.Option(50, "--max-files", help="Maximum context files (1-500)")
+MaxBytesOption = typer.Option(2048, "--max-bytes", help="Max context size in KB (1-10000)")
+BlacklistIgnoreOption = typer.Option([], "--blacklist-ignore", help="Ignore blacklist patterns")
+RedactionOption = typer.Option(True, "--redaction/--no-redaction", help="Auto-redact sensitive content")
+VerboseOption = typer.Option(False, "--verbose", "-v", help="Show detailed execution info")
+QuietOption = typer.Option(False, "--quiet", "-q", help="Suppress non-essential output")
+CacheOption = typer.Option(False, "--cache", help="Replay the stored answer when the same request was made before")
+
+# Planning options shared by task and agentic-task
+RiskLevelOption = typer.Option(
+    "moderate",
+    help="Risk tolerance: 'conservative' (safe, minimal risk), 'moderate' (balanced), 'aggressive' (fast, higher risk)",
+)
+
+# Write control options (only for applicable commands)
+WriteOption = typer.Option(False, "--write", help="Enable file modifications")
+ForceOption = typer.Option(False, "--force", help="Skip confirmation prompts")
@@ -0,0 +1,99 @@
+"""Root callback: top-level help text and the no-subcommand banner."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import typer
+
+from cli_commands.runtime import get_console, get_renderer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+APP_HELP = """AI CLI - Intelligent development assistance tool.
+
+Provides AI-powered help for common development tasks with built-in safety controls.
+All operations are sandboxed and require explicit consent for file modifications.
+
+Examples:
+  ai ask "How does authentication work?" --context
+  ai task "Add error handling to API" --risk-level conservative  
+  ai testwrite src/utils.py --write --framework pytest
+
+Safety: Operations are restricted to the current project directory. File writes
+require both use case capability AND explicit --write consent."""
+
+
+# Command overview printed when `ai` runs without a subcommand
+ROOT_BANNER = """[bold]Available Commands:[/bold]
+
+  [cyan]ask[/cyan]           Ask questions about code with optional project context
+  [cyan]task[/cyan]          Create structured plans for development objectives  
+  [cyan]agentic_task[/cyan]  🤖 AI agent that explores projects and creates comprehensive plans
+  [cyan]testwrite[/cyan]     Generate comprehensive test suites for your code
+  [cyan]daemon[/cyan]        Start/stop a background server that keeps the CLI warm
+
+[bold]Quick Examples:[/bold]
+
+  ai ask "How does authentication work?" --context
+  ai task "Add error handling" --risk-level conservative
+  ai agentic_task "Add user authentication" --mode explore+plan  
+  ai testwrite src/utils.py --write --framework pytest
+
+[bold]Global Options:[/bold]
+
+  --model TEXT           AI model selection (gpt-4o-mini, gpt-4o, gpt-4-turbo)
+  --max-files INT        Context file limit (default: 50)
+  --max-bytes INT        Context size limit in KB (default: 2048)  
+  --blacklist-ignore     Skip specific blacklist patterns
+  --redaction/--no-redaction  Control sensitive content filtering
+  --verbose, -v          Show detailed execution information
+  --quiet, -q            Suppress non-essential output
+  --cache                Replay stored answers to identical requests
+
+[bold]Safety Features:[/bold]
+
+  • All operations are sandboxed to the current project directory
+  • Sensitive files (.env, keys, credentials) are automatically excluded
+  • File writes require explicit --write consent AND use case capability
+  • Interactive confirmations prevent accidental modifications
+
+[dim]Use 'ai COMMAND --help' for detailed command information.[/dim]"""
+
+_root_banner_text: Text | None = None
+
+
+def _root_banner(console: Console) -> Text:
+    """Return ROOT_BANNER as styled text, parsing the markup only once."""
+    global _root_banner_text
+    if _root_banner_text is None:
+        # render_str applies markup, emoji and highlighting just like console.print(str)
+        _root_banner_text = console.render_str(ROOT_BANNER)
+    return _root_banner_text
+
+
+def main_callback(ctx: typer.Context) -> None:
+    """
+    AI CLI - Intelligent development assistance with built-in safety.
+    
+    A modern command-line tool that provides AI-powered help for common development
+    tasks including Q&A, planning, and test generation. All operations are sandboxed
+    and require explicit consent for file modifications.
+    """
+    if ctx.invoked_subcommand is None:
+        from utils.render import RunMeta
+
+        console = get_console()
+        renderer = get_renderer()
+        renderer.render_header(
+            RunMeta(
+                usecase="ai",
+                sandbox_badge="FULL SANDBOX",
+                model_name=None,
+            )
+        )
+        
+        console.print(_root_banner(console))
+
@@ -0,0 +1,78 @@
+"""Process-wide Rich console, renderer, OpenAI client and response cache shared by the CLI commands."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from rich.console import Console
+
+    from agent.cache import ResponseCache
+    from utils.render import Renderer
+
+_console: Console | None = None
+_renderer: Renderer | None = None
+# Keyed by (api key, base url) so a long-lived process follows env changes
+_openai_clients: dict[tuple[str | None, str | None], OpenAI] = {}
+_response_cache: ResponseCache | None = None
+
+
+def get_console() -> Console:
+    """Return the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def get_renderer() -> Renderer:
+    """Return the shared renderer bound to the shared console."""
+    global _renderer
+    if _renderer is None:
+        from utils.render import Renderer
+
+        _renderer = Renderer(get_console())
+    return _renderer
+
+
+def get_openai_client() -> OpenAI:
+    """Return a shared OpenAI client for the current credentials.
+
+    Reusing the client keeps its HTTP connection pool warm across commands
+    run by the same process (see the ``ai_cli_daemon`` package).
+    """
+    key = (os.environ.get("OPENAI_API_KEY"), os.environ.get("OPENAI_BASE_URL"))
+    client = _openai_clients.get(key)
+    if client is None:
+        from openai import OpenAI
+
+        client = _openai_clients[key] = OpenAI()
+    return client
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the shared on-disk cache of model responses.
+
+    Entries are keyed on the full request, including any project files in the
+    prompt, so editing a context file or switching models misses the cache.
+    Only commands run with ``--cache`` use it.
+    """
+    global _response_cache
+    if _response_cache is None:
+        from agent.cache import ResponseCache
+
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        _response_cache = ResponseCache(path=Path(cache_home) / "ai-cli" / "responses.sqlite3")
+    return _response_cache
+
+
+def reset() -> None:
+    """Drop the shared console and renderer so they are rebuilt on next use."""
+    global _console, _renderer
+    _console = None
+    _renderer = None
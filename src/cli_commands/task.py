@@ -0,0 +1,175 @@
+"""Task command: structured planning for development objectives."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from cli_commands.options import (
+    ModelOption,
+    MaxFilesOption,
+    MaxBytesOption,
+    BlacklistIgnoreOption,
+    RedactionOption,
+    VerboseOption,
+    QuietOption,
+    CacheOption,
+    RiskLevelOption,
+)
+from cli_commands.runtime import get_console, get_openai_client, get_renderer, get_response_cache
+
+# Command-specific options
+PlanModeOption = typer.Option(
+    "plan",
+    help="Planning depth: 'plan' (high-level steps), 'plan+steps' (detailed implementation steps)",
+)
+ContextOption = typer.Option(
+    False,
+    "--context",
+    help="Include project context (README.md, *.md, pyproject.toml, package.json)",
+)
+ContextPathsOption = typer.Option(
+    [],
+    "--path",
+    help="Specific files/directories to include as context (e.g., 'src/', 'docs/architecture.md')",
+)
+
+_TASK_HELP = """Create structured, actionable plans for development tasks.
+
+\b
+DESCRIPTION:
+    The 'task' command analyzes your objective and creates a detailed,
+    step-by-step plan with risk assessments, assumptions, and next actions.
+    It can incorporate your project's existing code and architecture.
+
+\b
+EXAMPLES:
+    # Simple planning
+    ai task "Add user authentication"
+    ai task "Optimize database queries" --risk-level conservative
+    ai task "Implement real-time notifications" --mode plan+steps
+    
+    # Context-aware planning
+    ai task "Add API rate limiting" --context
+    ai task "Refactor the payment system" --path "src/payments/"
+    ai task "Migrate to microservices" --context --mode plan+steps
+    
+    # Risk-based planning
+    ai task "Deploy to production" --risk-level conservative
+    ai task "Prototype new feature" --risk-level aggressive
+
+\b
+PLANNING MODES:
+    • plan: High-level strategic steps with risk assessment
+    • plan+steps: Detailed implementation steps with specific actions
+
+\b
+RISK LEVELS:
+    • conservative: Emphasizes safety, testing, gradual rollout
+    • moderate: Balanced approach with reasonable safeguards
+    • aggressive: Fast execution, accepting higher risks for speed
+
+\b
+CONTEXT & SAFETY:
+    • Runs in FULL SANDBOX mode (read-only, no file modifications)
+    • Plans based on your existing codebase when context is included
+    • Automatically excludes sensitive files and large binaries
+    • Provides structured output with risks, assumptions, next actions
+"""
+
+
+def task(
+    objective: str = typer.Argument(..., help="The task, feature, or objective you want to accomplish"),
+    
+    # Planning control options
+    mode: str = PlanModeOption,
+    risk_level: str = RiskLevelOption,
+    
+    # Context inclusion options  
+    use_context: bool = ContextOption,
+    context_paths: list[str] = ContextPathsOption,
+    
+    # Global context control options
+    model: str = ModelOption,
+    max_files: int = MaxFilesOption,
+    max_bytes_kb: int = MaxBytesOption,
+    blacklist_ignore: list[str] = BlacklistIgnoreOption,
+    redaction: bool = RedactionOption,
+    verbose: bool = VerboseOption,
+    quiet: bool = QuietOption,
+    cache: bool = CacheOption,
+) -> None:
+    """Create structured, actionable plans for development tasks."""
+    from llm.openai_provider import OpenAIProvider
+    from usecases.task import Task, TaskInput
+    from utils.render import RunMeta, Stopwatch
+
+    console = get_console()
+    renderer = get_renderer()
+    project_root = Path.cwd()
+    
+    with Stopwatch() as sw:
+        # Render header
+        renderer.render_header(
+            RunMeta(
+                usecase="task",
+                sandbox_badge="FULL SANDBOX",
+                model_name=model,
+            )
+        )
+        
+        # Prepare input
+        input_data = TaskInput(
+            objective=objective,
+            mode=mode,  # type: ignore
+            risk_level=risk_level,  # type: ignore
+            use_context=use_context,
+            context_paths=context_paths,
+        )
+        
+        # Apply global context control
+        if verbose:
+            console.print(f"[dim]Using model: {model}[/dim]")
+            console.print(f"[dim]Context limits: {max_files} files, {max_bytes_kb}KB[/dim]")
+            if blacklist_ignore:
+                console.print(f"[dim]Ignoring blacklist patterns: {blacklist_ignore}[/dim]")
+        
+        # Context summary (nothing to summarize without context)
+        total_paths = len(context_paths) if context_paths else (1 if use_context else 0)
+        if total_paths:
+            renderer.render_context_summary(
+                included_count=total_paths,
+                skipped_count=0,
+                redaction_on=True,
+                top_sources=context_paths[:3] or None,
+            )
+        
+        # Execute with progress indicator
+        try:
+            provider = OpenAIProvider(
+                get_openai_client(),
+                model=model,
+                cache=get_response_cache() if cache else None,
+            )
+            
+            # Create progress callback for live updates
+            def progress_callback(message: str):
+                console.print(f"[dim]{message}[/dim]")
+            
+            result = Task.execute(input_data, provider, project_root, progress_callback)
+            
+            # Render result
+            renderer.render_plan(result.plan, result.risks, result.assumptions, result.next_actions)
+            
+            if result.sources:
+                console.print(f"\n[dim]Sources: {len(result.sources)} files[/dim]")
+        
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the task command to the given Typer app."""
+    app.command(help=_TASK_HELP)(task)
@@ -0,0 +1,249 @@
+"""Testwrite command: test generation with optional sandboxed writes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from cli_commands.options import (
+    ModelOption,
+    MaxFilesOption,
+    MaxBytesOption,
+    BlacklistIgnoreOption,
+    RedactionOption,
+    VerboseOption,
+    QuietOption,
+    CacheOption,
+    WriteOption,
+    ForceOption,
+)
+from cli_commands.runtime import get_console, get_openai_client, get_renderer, get_response_cache
+
+# Command-specific options
+FrameworkOption = typer.Option(
+    "pytest",
+    help="Testing framework: 'pytest' (recommended), 'unittest' (Python standard library)",
+)
+PlacementOption = typer.Option(
+    "new_file",
+    help="Test file placement: 'new_file' (separate test files), 'inline' (same file as code)",
+)
+ContextOption = typer.Option(
+    True,
+    "--context/--no-context",
+    help="Include target file and related Python files as context for better test generation",
+)
+ContextPathsOption = typer.Option(
+    [],
+    "--path",
+    help="Additional files to include as context (e.g., 'src/models.py', 'tests/conftest.py')",
+)
+
+_TESTWRITE_HELP = """Generate comprehensive test suites for your code.
+
+\b
+DESCRIPTION:
+    The 'testwrite' command analyzes your code and generates thorough test
+    files following testing best practices. It can preview proposed tests
+    or write them directly to your project with the --write flag.
+
+\b
+EXAMPLES:
+    # Preview test generation
+    ai testwrite src/utils.py
+    ai testwrite src/api/users.py --framework unittest
+    ai testwrite src/ --framework pytest --placement new_file
+    
+    # Generate and write test files
+    ai testwrite src/models.py --write
+    ai testwrite src/api/ --write --framework pytest --force
+    ai testwrite src/utils.py --write --path "tests/conftest.py"
+    
+    # Context-aware generation
+    ai testwrite src/auth.py --context --path "src/models.py"
+    ai testwrite src/api/ --no-context
+
+\b
+TESTING FRAMEWORKS:
+    • pytest: Modern Python testing (fixtures, parametrize, plugins)
+      - Uses test_*.py naming convention
+      - Automatic fixture discovery and rich assertion introspection
+    
+    • unittest: Python standard library testing
+      - Uses TestCase classes with setUp/tearDown methods
+      - Built-in mocking capabilities
+
+\b
+TEST PLACEMENT:
+    • new_file: Creates separate test files (recommended)
+      - Follows framework conventions (test_*.py)
+      - Keeps tests organized and discoverable
+    
+    • inline: Adds tests within the same file
+      - Useful for simple utilities or prototypes
+      - Uses if __name__ == '__main__' blocks
+
+\b
+CONTEXT & SAFETY:
+    • Runs in LIMITED SANDBOX mode (controlled write access)
+    • File writes require both --write flag AND use case capability
+    • Interactive confirmation before writing (use --force to skip)
+    • Automatically includes target file and related Python files
+    • Excludes test files, builds, and sensitive files from context
+
+\b
+WHAT'S GENERATED:
+    • Comprehensive unit tests for functions, classes, methods
+    • Edge case and error condition testing
+    • Proper mocking for external dependencies
+    • Framework-specific best practices and clear organization
+    
+    Without --write: shows preview of proposed test files and changes
+    With --write: creates/updates test files after confirmation
+"""
+
+
+def testwrite(
+    target: str = typer.Argument(..., help="Target file or directory to generate comprehensive tests for"),
+    
+    # Test generation options
+    framework: str = FrameworkOption,
+    placement: str = PlacementOption,
+    
+    # Context inclusion options
+    use_context: bool = ContextOption,
+    context_paths: list[str] = ContextPathsOption,
+    
+    # Global context control options
+    model: str = ModelOption,
+    max_files: int = MaxFilesOption,
+    max_bytes_kb: int = MaxBytesOption,
+    blacklist_ignore: list[str] = BlacklistIgnoreOption,
+    redaction: bool = RedactionOption,
+    verbose: bool = VerboseOption,
+    quiet: bool = QuietOption,
+    cache: bool = CacheOption,
+    
+    # File modification options
+    write: bool = WriteOption,
+    force: bool = ForceOption,
+) -> None:
+    """Generate comprehensive test suites for your code."""
+    from llm.openai_provider import OpenAIProvider
+    from usecases.testwrite import TestWrite, TestWriteInput
+    from utils.render import RunMeta, Stopwatch
+
+    console = get_console()
+    renderer = get_renderer()
+    project_root = Path.cwd()
+    
+    with Stopwatch() as sw:
+        # Render header
+        sandbox_badge = "LIMITED SANDBOX" + (" + WRITES" if write else " (READ-ONLY)")
+        renderer.render_header(
+            RunMeta(
+                usecase="testwrite",
+                sandbox_badge=sandbox_badge,
+                model_name=model,
+            )
+        )
+        
+        # Prepare input
+        input_data = TestWriteInput(
+            target=target,
+            framework=framework,  # type: ignore
+            placement=placement,  # type: ignore
+            use_context=use_context,
+            context_paths=context_paths,
+        )
+        
+        # Apply global context control
+        if verbose:
+            console.print(f"[dim]Using model: {model}[/dim]")
+            console.print(f"[dim]Context limits: {max_files} files, {max_bytes_kb}KB[/dim]")
+            if blacklist_ignore:
+                console.print(f"[dim]Ignoring blacklist patterns: {blacklist_ignore}[/dim]")
+        
+        # Context summary
+        total_paths = len(context_paths) + (1 if use_context else 0)  # +1 for target
+        renderer.render_context_summary(
+            included_count=total_paths,
+            skipped_count=0,
+            redaction_on=True,
+            top_sources=[target, *context_paths[:2]],
+        )
+        
+        # Execute
+        try:
+            provider = OpenAIProvider(
+                get_openai_client(),
+                model=model,
+                cache=get_response_cache() if cache else None,
+            )
+            result = TestWrite.execute(input_data, provider, project_root)
+            
+            # Render result
+            renderer.render_proposed_files(result.proposed_files, result.rationale, result.coverage_targets)
+            
+            if result.sources:
+                console.print(f"\n[dim]Sources: {len(result.sources)} files[/dim]")
+        
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
+    
+    # File writing happens outside the timed block so waiting on the
+    # confirmation prompt is not counted as execution time
+    if not write:
+        console.print(f"\n[dim]Note: Files not written (use --write to enable)[/dim]")
+        return
+    if not result.proposed_files:
+        return
+    
+    from core.sandbox import SandboxMode, SandboxPolicy, SandboxGuard
+    from utils.fs import create_file_writer
+    
+    # Create sandbox with write consent
+    sandbox_policy = SandboxPolicy(
+        mode=SandboxMode.LIMITED,
+        project_root=project_root,
+        allows_writes=True,  # TestWrite declares this capability
+        user_write_consent=write,
+    )
+    sandbox_guard = SandboxGuard(sandbox_policy)
+    
+    try:
+        file_writer = create_file_writer(sandbox_guard)
+        
+        # Add all proposed operations
+        for proposed_file in result.proposed_files:
+            file_path = project_root / proposed_file.path
+            file_writer.add_operation(file_path, proposed_file.content, proposed_file.action)
+        
+        # Confirm before writing (unless --force)
+        if not force:
+            console.print()
+            prompt = f"About to write {len(result.proposed_files)} files. Continue?"
+            if not typer.confirm(typer.style(prompt, fg=typer.colors.YELLOW), default=False):
+                console.print("[dim]Cancelled.[/dim]")
+                return
+        
+        # Execute file operations
+        changes = file_writer.execute_operations(dry_run=False)
+        
+        console.print(f"\n[bold green]File Operations:[/bold green]")
+        for change in changes:
+            if "Failed" in change:
+                console.print(f"  [red]{change}[/red]")
+            else:
+                console.print(f"  [green]{change}[/green]")
+    
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the testwrite command to the given Typer app."""
+    app.command(help=_TESTWRITE_HELP)(testwrite)
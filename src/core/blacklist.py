@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
-from pathlib import Path
+from fnmatch import translate
+from pathlib import Path, PurePath
 from typing import Iterable, Sequence
 
 
@@ -18,38 +20,73 @@ DEFAULT_BLACKLIST: tuple[str, ...] = (
 )
 
 
+def compile_patterns(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile blacklist patterns into one regex matched against posix paths.
+
+    Directory patterns (trailing slash) match the directory itself and anything
+    below it; other patterns use fnmatch semantics. Returns None when there are
+    no patterns, so callers can skip matching entirely.
+    """
+    parts = []
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            parts.append(re.escape(pattern.rstrip("/")) + r"(?:/.*)?\Z")
+        else:
+            parts.append(translate(pattern))
+    if not parts:
+        return None
+    return re.compile("|".join(parts), re.DOTALL)
+
+
+def _directory_patterns(patterns: Iterable[str]) -> list[str]:
+    return [pattern for pattern in patterns if pattern.endswith("/")]
+
+
+DEFAULT_BLACKLIST_RE = compile_patterns(DEFAULT_BLACKLIST)
+DEFAULT_PRUNE_RE = compile_patterns(_directory_patterns(DEFAULT_BLACKLIST))
+
+
 @dataclass(slots=True)
 class Blacklist:
-    patterns: Sequence[str] = field(default_factory=lambda: list(DEFAULT_BLACKLIST))
-    extra_ignores: Sequence[str] = field(default_factory=list)
+    patterns: Sequence[str] = DEFAULT_BLACKLIST
+    extra_ignores: Sequence[str] = ()
+    _blocked_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    _ignore_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    _prune_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if tuple(self.patterns) == DEFAULT_BLACKLIST:
+            self._blocked_re = DEFAULT_BLACKLIST_RE
+            self._prune_re = DEFAULT_PRUNE_RE
+        else:
+            self._blocked_re = compile_patterns(self.patterns)
+            self._prune_re = compile_patterns(_directory_patterns(self.patterns))
+        self._ignore_re = compile_patterns(self.extra_ignores)
+        if self._ignore_re is not None:
+            # An ignore may re-allow something inside a blocked directory
+            self._prune_re = None
 
-    def is_blocked(self, path: Path) -> bool:
+    def is_blocked(self, path: str | os.PathLike[str]) -> bool:
+        if self._blocked_re is None:
+            return False
         normalized = self._normalize(path)
-        for pattern in self.patterns:
-            if self._match(normalized, pattern):
-                # Allow targeted exceptions
-                for ignore in self.extra_ignores:
-                    if self._match(normalized, ignore):
-                        return False
-                return True
-        return False
+        if not self._blocked_re.match(normalized):
+            return False
+        # Allow targeted exceptions
+        return not (self._ignore_re and self._ignore_re.match(normalized))
+
+    def prunes(self, directory: Path) -> bool:
+        """Whether everything below `directory` is blocked, so a walk can skip it."""
+        if self._prune_re is None:
+            return False
+        return self._prune_re.match(self._normalize(directory)) is not None
 
     def filter_paths(self, paths: Iterable[Path]) -> list[Path]:
         return [p for p in paths if not self.is_blocked(p)]
 
     @staticmethod
-    def _normalize(path: Path) -> str:
+    def _normalize(path: str | os.PathLike[str]) -> str:
         # Represent as posix-style relative string for fnmatch
-        return path.as_posix()
-
-    @staticmethod
-    def _match(candidate: str, pattern: str) -> bool:
-        # Handle directory patterns with trailing slashes
-        if pattern.endswith("/"):
-            # For directory patterns, match if candidate starts with the directory name
-            pattern_prefix = pattern.rstrip("/")
-            return (candidate == pattern_prefix or 
-                    candidate.startswith(pattern_prefix + "/"))
-        
-        # Regular fnmatch for file patterns
-        return fnmatch(candidate, pattern)
+        if isinstance(path, PurePath):
+            return path.as_posix()
+        return os.fspath(path).replace(os.sep, "/")
@@ -1,50 +1,95 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
 
 from .blacklist import Blacklist
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextCaps:
     max_files: int = 200
     max_total_bytes: int = 5 * 1024 * 1024  # 5 MiB
     max_file_bytes: int = 512 * 1024  # 512 KiB
 
 
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS = frozenset({
     ".md", ".txt", ".py", ".ts", ".tsx", ".js", ".json", ".toml", ".yaml", ".yml",
     ".go", ".rs", ".java", ".kt", ".sh", ".bash", ".zsh", ".sql",
-}
+})
+
+# Rejected by extension alone, without reading the file
+KNOWN_BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".mp4", ".mov", ".zip", ".tar", ".gz",
+    ".pdf", ".so", ".dylib", ".pyc",
+})
 
 
 def looks_binary(path: Path) -> bool:
     # Heuristic: extension or initial bytes check
-    if path.suffix.lower() not in TEXT_EXTENSIONS:
-        try:
-            with path.open("rb") as f:
-                head = f.read(4000)
-            if b"\0" in head:
-                return True
-        except Exception:
-            return True
-    return False
+    suffix = path.suffix.lower()
+    if suffix in TEXT_EXTENSIONS:
+        return False
+    if suffix in KNOWN_BINARY_EXTENSIONS:
+        return True
+    try:
+        with path.open("rb") as f:
+            head = f.read(4000)
+    except Exception:
+        return True
+    return b"\0" in head
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestResult:
     included: list[Path]
     skipped: list[Path]
     total_bytes: int
 
 
+def _walk_files(root: Path, blacklist: Blacklist, skipped: list[Path]) -> Iterator[Path]:
+    """Yield the files below `root`, without descending into pruned directories.
+
+    Directories the blacklist prunes are recorded in `skipped` as a whole, so a
+    `.git/` or `node_modules/` tree costs one entry instead of a full walk.
+    Symlinked directories are not followed, matching `Path.rglob`.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if blacklist.prunes(path.relative_to(root)):
+                        skipped.append(path)
+                    else:
+                        stack.append(path)
+                elif entry.is_file():
+                    yield path
+            except OSError:
+                continue
+
+
 def collect_paths(
     roots: Iterable[Path],
     blacklist: Blacklist,
     caps: ContextCaps | None = None,
 ) -> IngestResult:
+    """Walk `roots` and pick the files that fit within `caps`.
+
+    Every file that is not included ends up in `skipped`, including those
+    past the `max_files` cap, so its length is the number of files left out
+    (pruned directories count once).
+    """
     caps = caps or ContextCaps()
     included: list[Path] = []
     skipped: list[Path] = []
@@ -54,19 +99,22 @@ def collect_paths(
         root = root if root.is_absolute() else Path.cwd() / root
         if root.is_file():
             candidates = [root]
+            rel_base = root.parent
         elif root.is_dir():
-            candidates = [p for p in root.rglob("*") if p.is_file()]
+            candidates = _walk_files(root, blacklist, skipped)
+            rel_base = root
         else:
             skipped.append(root)
             continue
 
         for p in candidates:
+            # Once full, only list the rest; no need to stat or sniff it
+            if len(included) >= caps.max_files:
+                skipped.append(p)
+                continue
             # Check against blacklist using relative path from the root
             try:
-                if root.is_dir():
-                    rel_path = p.relative_to(root)
-                else:
-                    rel_path = p.relative_to(root.parent)
+                rel_path = p.relative_to(rel_base)
             except ValueError:
                 rel_path = p
                 
@@ -87,10 +135,25 @@ def collect_paths(
             if total + size > caps.max_total_bytes:
                 skipped.append(p)
                 continue
-            if len(included) >= caps.max_files:
-                skipped.append(p)
-                continue
             included.append(p)
             total += size
 
     return IngestResult(included=included, skipped=skipped, total_bytes=total)
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def read_texts(paths: Sequence[Path], max_workers: int = 8) -> list[str | None]:
+    """Read files as UTF-8 in parallel, in input order; None where a read fails.
+
+    Overlapping the reads pays off on cold caches and network filesystems.
+    """
+    if len(paths) <= 1:
+        return [_read_text(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(_read_text, paths))
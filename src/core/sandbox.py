@@ -55,6 +55,8 @@ class SandboxGuard:
 
     def __init__(self, policy: SandboxPolicy) -> None:
         self._policy = policy
+        # The root is canonicalized once; only checked paths are resolved per call
+        self._resolved_root = policy.project_root.resolve()
 
     @property
     def policy(self) -> SandboxPolicy:
@@ -62,7 +64,7 @@ class SandboxGuard:
 
     def assert_path_within_project(self, path: Path) -> None:
         try:
-            path.resolve().relative_to(self._policy.project_root.resolve())
+            path.resolve().relative_to(self._resolved_root)
         except Exception as exc:  # Path is outside project
             raise SandboxViolation(
                 f"Path '{path}' escapes project root '{self._policy.project_root}'"
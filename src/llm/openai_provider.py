@@ -2,33 +2,73 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import time
-from typing import Any, TypeVar, Callable
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, TypeVar, Callable
 
 from openai import OpenAI
 from pydantic import BaseModel
 
 from .provider import Provider, ProviderResponse
 
+if TYPE_CHECKING:
+    from agent.cache import ResponseCache
+
 T = TypeVar("T", bound=BaseModel)
 
 
+@functools.cache
+def _json_schema(response_model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema of a response model, generated once per model class."""
+    return response_model.model_json_schema()
+
+
 class OpenAIProvider(Provider):
-    def __init__(self, client: OpenAI | None = None, *, model: str = "gpt-5-mini") -> None:
+    def __init__(
+        self,
+        client: OpenAI | None = None,
+        *,
+        model: str = "gpt-5-mini",
+        cache: ResponseCache | None = None,
+    ) -> None:
         self._client = client or OpenAI()
         self._model = model
+        # Replays responses to byte-identical requests (disabled if None)
+        self._cache = cache
 
-    def generate_structured(self, *, prompt: str, response_model: type[T]) -> ProviderResponse[T]:
-        schema = response_model.model_json_schema()
+    @property
+    def client(self) -> OpenAI:
+        """Underlying OpenAI client; share it to reuse its HTTP connection pool."""
+        return self._client
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Response cache, if any; providers wrapping this one can share it."""
+        return self._cache
+
+    def _build_request(self, prompt: str, response_model: type[T]) -> dict[str, Any]:
+        schema = _json_schema(response_model)
         # Using chat completions with structured outputs
-        result = self._client.chat.completions.create(
-            model=self._model,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_schema", "json_schema": {"name": "Output", "schema": schema}},
-        )
+        return {
+            "model": self._model,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_schema", "json_schema": {"name": "Output", "schema": schema}},
+        }
+
+    def _complete(
+        self,
+        api_params: dict[str, Any],
+        response_model: type[T],
+        progress_callback: Callable[[str], None] | None = None,
+    ) -> ProviderResponse[T]:
+        result = self._client.chat.completions.create(**api_params)
+        
+        if progress_callback:
+            progress_callback("✨ Parsing response...")
+        
         # Extract the response data
-        raw = result.model_dump() if hasattr(result, "model_dump") else result
         message = result.choices[0].message
         
         # Parse the structured response
@@ -40,7 +80,11 @@ class OpenAIProvider(Provider):
         else:
             raise RuntimeError("Unable to parse structured response from OpenAI result")
             
-        return ProviderResponse(output=data, raw=raw, model=self._model, usage=result.usage)
+        # Keep the SDK object as is; callers that need a dict can model_dump() it
+        return ProviderResponse(output=data, raw=result, model=self._model, usage=result.usage)
+
+    def generate_structured(self, *, prompt: str, response_model: type[T]) -> ProviderResponse[T]:
+        return self.generate_structured_streaming(prompt=prompt, response_model=response_model)
     
     def generate_structured_streaming(
         self, 
@@ -50,7 +94,14 @@ class OpenAIProvider(Provider):
         progress_callback: Callable[[str], None] | None = None
     ) -> ProviderResponse[T]:
         """Generate structured output with streaming and progress updates."""
-        schema = response_model.model_json_schema()
+        api_params = self._build_request(prompt, response_model)
+        cache_key = self._cache.key(api_params) if self._cache is not None else None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback("♻️ Using cached response")
+                return cached
         
         if progress_callback:
             progress_callback("🤖 Contacting OpenAI...")
@@ -60,34 +111,16 @@ class OpenAIProvider(Provider):
             if progress_callback:
                 progress_callback(f"🧠 Processing with {self._model}...")
             
-            result = self._client.chat.completions.create(
-                model=self._model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_schema", "json_schema": {"name": "Output", "schema": schema}},
-            )
-            
-            if progress_callback:
-                progress_callback("✨ Parsing response...")
-            
-            # Extract the response data (same as non-streaming)
-            raw = result.model_dump() if hasattr(result, "model_dump") else result
-            message = result.choices[0].message
-            
-            # Parse the structured response
-            data: Any
-            if hasattr(message, 'parsed') and message.parsed:
-                data = response_model.model_validate(message.parsed)
-            elif message.content:
-                data = response_model.model_validate_json(message.content)
-            else:
-                raise RuntimeError("Unable to parse structured response from OpenAI result")
+            response = self._complete(api_params, response_model, progress_callback)
                 
             if progress_callback:
                 progress_callback("✅ Complete!")
-                
-            return ProviderResponse(output=data, raw=raw, model=self._model, usage=result.usage)
             
         except Exception as e:
             if progress_callback:
                 progress_callback(f"❌ Error: {str(e)}")
             raise
+        
+        if cache_key is not None:
+            self._cache.put(cache_key, replace(response, raw=None))
+        return response
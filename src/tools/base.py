@@ -7,7 +7,7 @@ from typing import Any, Dict, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution."""
     success: bool
@@ -30,6 +30,12 @@ class Tool(ABC):
     Each tool has a name, description, parameter schema, and execution method.
     """
     
+    # Shared resources the tool reads and writes. Calls from one LLM turn whose
+    # resources don't conflict may run concurrently; None means undeclared,
+    # which conflicts with everything.
+    reads: frozenset[str] | None = None
+    writes: frozenset[str] | None = None
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -63,6 +69,19 @@ class Tool(ABC):
         """
         pass
     
+    def conflicts_with(self, other: Tool) -> bool:
+        """Check whether running this tool concurrently with another could race.
+        
+        Args:
+            other: Tool whose call would run alongside this one
+            
+        Returns:
+            True if either tool writes something the other reads or writes
+        """
+        if None in (self.reads, self.writes, other.reads, other.writes):
+            return True
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+    
     def get_function_schema(self) -> dict:
         """Get OpenAI function calling schema for this tool."""
         return {
@@ -80,6 +99,7 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        self._schemas: List[dict] | None = None
     
     def register(self, tool: Tool) -> None:
         """Register a tool.
@@ -94,6 +114,7 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         
         self._tools[tool.name] = tool
+        self._schemas = None
     
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name.
@@ -125,10 +146,15 @@ class ToolRegistry:
     def get_function_schemas(self) -> List[dict]:
         """Get all tool schemas for function calling.
         
+        The list is built once and reused until another tool is registered,
+        so callers must not mutate it.
+        
         Returns:
             List of OpenAI function calling schemas
         """
-        return [tool.get_function_schema() for tool in self._tools.values()]
+        if self._schemas is None:
+            self._schemas = [tool.get_function_schema() for tool in self._tools.values()]
+        return self._schemas
     
     def execute_tool(self, name: str, **kwargs) -> ToolResult:
         """Execute a tool by name.
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,12 @@ from core.blacklist import Blacklist
 class TreeTool(Tool):
     """Tool to show directory tree structure with configurable depth."""
     
+    reads = frozenset({"filesystem"})
+    writes = frozenset()
+    
+    _ALLOWED_HIDDEN = frozenset({'.gitignore', '.env.example', '.github'})
+    _SOURCE_SUFFIXES = frozenset({'.py', '.js', '.ts', '.go', '.rs'})
+    
     def __init__(self, project_root: Path, blacklist: Blacklist | None = None):
         """Initialize TreeTool.
         
@@ -20,6 +28,7 @@ class TreeTool(Tool):
             blacklist: Blacklist instance for filtering files
         """
         self.project_root = project_root
+        self._resolved_root = project_root.resolve()
         self.blacklist = blacklist or Blacklist()
     
     @property
@@ -65,7 +74,7 @@ class TreeTool(Tool):
             
             # Security check - ensure path is within project root
             try:
-                target_path.resolve().relative_to(self.project_root.resolve())
+                target_path.resolve().relative_to(self._resolved_root)
             except ValueError:
                 return ToolResult(
                     success=False, 
@@ -84,7 +93,7 @@ class TreeTool(Tool):
                     error=f"Path '{path}' is not a directory"
                 )
             
-            tree_output = self._build_tree(target_path, depth, 0, "")
+            tree_output = self._build_tree(target_path, depth)
             
             # Prepare result with metadata
             result_data = {
@@ -102,68 +111,93 @@ class TreeTool(Tool):
                 error=f"Failed to build tree: {str(e)}"
             )
     
-    def _build_tree(self, path: Path, max_depth: int, current_depth: int, prefix: str) -> str:
-        """Recursively build tree structure.
+    def _build_tree(self, root: Path, max_depth: int) -> str:
+        """Build tree structure with an explicit stack of directory iterators.
         
         Args:
-            path: Current directory path
-            max_depth: Maximum depth to recurse
-            current_depth: Current recursion depth
-            prefix: Current line prefix for formatting
+            root: Directory to show
+            max_depth: Maximum depth to descend
             
         Returns:
             Tree structure as formatted string
         """
-        if current_depth >= max_depth:
+        if max_depth <= 0:
             return ""
         
-        items = []
-        try:
-            for item in sorted(path.iterdir()):
-                # Skip hidden files except important ones
-                if (item.name.startswith('.') and 
-                    item.name not in {'.gitignore', '.env.example', '.github'}):
-                    continue
-                
-                # Check blacklist
-                relative_path = item.relative_to(self.project_root)
-                if self.blacklist.is_blocked(relative_path):
-                    continue
-                
-                items.append(item)
-                
-        except PermissionError:
-            return f"{prefix}[Permission Denied]\n"
+        children = self._tree_children(root)
+        if children is None:
+            return "[Permission Denied]\n"
         
-        if not items:
-            return ""
-        
-        result = ""
-        for i, item in enumerate(items):
-            is_last = i == len(items) - 1
-            current_prefix = "└── " if is_last else "├── "
-            next_prefix = "    " if is_last else "│   "
+        lines: list[str] = []
+        # Each frame: (remaining children, child count, line prefix, depth)
+        stack = [(enumerate(children), len(children), "", 0)]
+        while stack:
+            remaining, count, prefix, depth = stack[-1]
+            step = next(remaining, None)
+            if step is None:
+                stack.pop()
+                continue
+            
+            i, entry = step
+            is_last = i == count - 1
+            is_dir = entry.is_dir()
             
             # Add special indicators
-            display_name = item.name
-            if item.is_dir():
+            display_name = entry.name
+            if is_dir:
                 display_name += "/"
-            elif item.suffix in {'.py', '.js', '.ts', '.go', '.rs'}:
+            elif os.path.splitext(entry.name)[1] in self._SOURCE_SUFFIXES:
                 display_name += "*"  # Executable/source indicator
             
-            result += f"{prefix}{current_prefix}{display_name}\n"
+            lines.append(f"{prefix}{'└── ' if is_last else '├── '}{display_name}\n")
             
-            # Recurse into directories
-            if item.is_dir() and current_depth + 1 < max_depth:
-                subtree = self._build_tree(item, max_depth, current_depth + 1, prefix + next_prefix)
-                result += subtree
+            # Descend into directories; their lines come before the next sibling's
+            if is_dir and depth + 1 < max_depth:
+                child_prefix = prefix + ("    " if is_last else "│   ")
+                grandchildren = self._tree_children(Path(entry.path))
+                if grandchildren is None:
+                    lines.append(f"{child_prefix}[Permission Denied]\n")
+                elif grandchildren:
+                    stack.append((enumerate(grandchildren), len(grandchildren), child_prefix, depth + 1))
+        
+        return "".join(lines)
+    
+    def _tree_children(self, path: Path) -> list[os.DirEntry[str]] | None:
+        """Visible entries of a directory in display order, or None if unreadable."""
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=attrgetter('name'))
+        except PermissionError:
+            return None
+        
+        # Blacklist paths are matched as posix strings relative to the root
+        relative_dir = path.relative_to(self.project_root).as_posix()
+        prefix = "" if relative_dir == "." else relative_dir + "/"
         
-        return result
+        children = []
+        for entry in entries:
+            # Skip hidden files except important ones
+            if (entry.name.startswith('.') and 
+                entry.name not in self._ALLOWED_HIDDEN):
+                continue
+            
+            # Check blacklist
+            if self.blacklist.is_blocked(prefix + entry.name):
+                continue
+            
+            children.append(entry)
+        return children
 
 
 class ReadFileTool(Tool):
     """Tool to read file contents with blacklist and security checks."""
     
+    reads = frozenset({"filesystem"})
+    writes = frozenset()
+    
+    _MAX_BYTES = 1024 * 1024  # 1MB
+    _SNIFF_BYTES = 8192
+    
     def __init__(self, project_root: Path, blacklist: Blacklist | None = None):
         """Initialize ReadFileTool.
         
@@ -172,6 +206,7 @@ class ReadFileTool(Tool):
             blacklist: Blacklist instance for filtering files
         """
         self.project_root = project_root
+        self._resolved_root = project_root.resolve()
         self.blacklist = blacklist or Blacklist()
     
     @property
@@ -209,27 +244,14 @@ class ReadFileTool(Tool):
             
             # Security check - ensure path is within project root
             try:
-                file_path.resolve().relative_to(self.project_root.resolve())
+                file_path.resolve().relative_to(self._resolved_root)
             except ValueError:
                 return ToolResult(
                     success=False, 
                     error=f"Path '{path}' is outside project root"
                 )
             
-            # Check if file exists
-            if not file_path.exists():
-                return ToolResult(
-                    success=False, 
-                    error=f"File '{path}' does not exist"
-                )
-            
-            if not file_path.is_file():
-                return ToolResult(
-                    success=False, 
-                    error=f"'{path}' is not a file"
-                )
-            
-            # Check blacklist
+            # Check blacklist before touching the file
             relative_path = file_path.relative_to(self.project_root)
             if self.blacklist.is_blocked(relative_path):
                 return ToolResult(
@@ -238,33 +260,43 @@ class ReadFileTool(Tool):
                            f"This may contain sensitive information like API keys, passwords, or private data."
                 )
             
-            # Check file size (limit to 1MB for safety)
-            file_size = file_path.stat().st_size
-            if file_size > 1024 * 1024:  # 1MB
-                return ToolResult(
-                    success=False, 
-                    error=f"File '{path}' is too large ({file_size} bytes). Maximum size is 1MB."
-                )
-            
-            # Check if binary
-            if self._is_binary_file(file_path):
+            if not file_path.is_file():
+                if not file_path.exists():
+                    return ToolResult(
+                        success=False, 
+                        error=f"File '{path}' does not exist"
+                    )
                 return ToolResult(
                     success=False, 
-                    error=f"File '{path}' appears to be binary and cannot be read as text"
+                    error=f"'{path}' is not a file"
                 )
             
-            # Read file content
-            try:
-                content = file_path.read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                # Try with different encoding
-                try:
-                    content = file_path.read_text(encoding='latin-1')
-                except UnicodeDecodeError:
+            # Size check, binary sniff and read share one open file
+            with file_path.open('rb') as f:
+                # Check file size (limit to 1MB for safety)
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size > self._MAX_BYTES:
                     return ToolResult(
                         success=False, 
-                        error=f"File '{path}' contains non-UTF-8 content and cannot be decoded"
+                        error=f"File '{path}' is too large ({file_size} bytes). Maximum size is 1MB."
                     )
+                
+                # Null bytes in the first chunk indicate binary
+                head = f.read(self._SNIFF_BYTES)
+                if b'\0' in head:
+                    return ToolResult(
+                        success=False, 
+                        error=f"File '{path}' appears to be binary and cannot be read as text"
+                    )
+                raw = head + f.read()
+            
+            try:
+                content = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                # latin-1 maps every byte, so this cannot fail
+                content = raw.decode('latin-1')
+            # Match read_text()'s universal newline translation
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
             
             # Prepare result data
             result_data = {
@@ -281,20 +313,3 @@ class ReadFileTool(Tool):
                 success=False, 
                 error=f"Failed to read file '{path}': {str(e)}"
             )
-    
-    def _is_binary_file(self, file_path: Path) -> bool:
-        """Check if file is binary by reading first chunk.
-        
-        Args:
-            file_path: Path to file to check
-            
-        Returns:
-            True if file appears to be binary
-        """
-        try:
-            with file_path.open('rb') as f:
-                chunk = f.read(1024)
-                # Check for null bytes which indicate binary
-                return b'\0' in chunk
-        except Exception:
-            return True
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 from .base import Tool, ToolResult
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     """Individual todo item."""
     number: int
@@ -21,11 +21,17 @@ class TodoItem:
         return f"- {checkbox} {self.number}. {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoList:
     """Manages a list of todo items with markdown output."""
     items: List[TodoItem] = field(default_factory=list)
     _next_number: int = field(default=1, init=False)
+    _by_number: Dict[int, TodoItem] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._by_number = {item.number: item for item in self.items}
+        # Continue numbering after any items passed in
+        self._next_number = max(self._by_number, default=0) + 1
     
     def add(self, text: str) -> int:
         """Add a new todo item.
@@ -38,6 +44,7 @@ class TodoList:
         """
         item = TodoItem(self._next_number, text)
         self.items.append(item)
+        self._by_number[item.number] = item
         self._next_number += 1
         return item.number
     
@@ -76,10 +83,7 @@ class TodoList:
     
     def _find_item(self, number: int) -> Optional[TodoItem]:
         """Find todo item by number."""
-        for item in self.items:
-            if item.number == number:
-                return item
-        return None
+        return self._by_number.get(number)
     
     def to_markdown(self) -> str:
         """Convert entire todo list to markdown format.
@@ -111,12 +115,16 @@ class TodoList:
     def clear(self) -> None:
         """Clear all todos and reset numbering."""
         self.items.clear()
+        self._by_number.clear()
         self._next_number = 1
 
 
 class TodoViewTool(Tool):
     """Tool to view the current todo list."""
     
+    reads = frozenset({"todo"})
+    writes = frozenset()
+    
     def __init__(self, todo_list: TodoList):
         """Initialize TodoViewTool.
         
@@ -160,6 +168,9 @@ class TodoViewTool(Tool):
 class TodoEditTool(Tool):
     """Tool to edit a specific todo item by number."""
     
+    reads = frozenset({"todo"})
+    writes = frozenset({"todo"})
+    
     def __init__(self, todo_list: TodoList):
         """Initialize TodoEditTool.
         
@@ -241,6 +252,9 @@ class TodoEditTool(Tool):
 class TodoAddTool(Tool):
     """Tool to add a new todo item to the list."""
     
+    reads = frozenset({"todo"})
+    writes = frozenset({"todo"})
+    
     def __init__(self, todo_list: TodoList):
         """Initialize TodoAddTool.
         
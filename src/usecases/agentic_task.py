@@ -7,7 +7,7 @@ understand the requirements, and create comprehensive action plans.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Callable, Literal
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +18,10 @@ from core.sandbox import SandboxMode
 from tools import ToolRegistry, TreeTool, ReadFileTool, TodoViewTool, TodoEditTool, TodoAddTool
 from usecases.ask import usecase
 
+if TYPE_CHECKING:
+    from agent import ToolCallingProvider
+    from llm.provider import Provider
+
 
 class AgenticTaskInput(UsecaseInput):
     """Input for agentic task usecase."""
@@ -75,13 +79,19 @@ class AgenticTask:
     OutputModel = AgenticTaskOutput
     
     @staticmethod
-    def execute(input_data: AgenticTaskInput, provider, project_root: Path) -> AgenticTaskOutput:
+    def execute(
+        input_data: AgenticTaskInput,
+        provider: Provider | ToolCallingProvider,
+        project_root: Path,
+        on_iteration: Callable[[AgentState], None] | None = None,
+    ) -> AgenticTaskOutput:
         """Execute the agentic task planning.
         
         Args:
             input_data: Input parameters for the task
             provider: LLM provider (will be wrapped for tool calling)
             project_root: Root directory of the project
+            on_iteration: Called with the agent state after each iteration
             
         Returns:
             AgenticTaskOutput with comprehensive plan and analysis
@@ -91,8 +101,13 @@ class AgenticTask:
             # Already a tool calling provider
             tool_provider = provider
         else:
-            # Wrap regular provider - for now we'll use OpenAI directly
-            tool_provider = OpenAIToolCallingProvider(model="gpt-4o")
+            # Wrap regular provider, reusing its client so every agent iteration
+            # goes through the same pooled HTTP connections, and its cache
+            tool_provider = OpenAIToolCallingProvider(
+                client=getattr(provider, "client", None),
+                model="gpt-4o",
+                cache=getattr(provider, "cache", None),
+            )
         
         # Set up tools and agent state
         tool_registry, agent_state = AgenticTask._setup_agent_components(
@@ -105,7 +120,8 @@ class AgenticTask:
             tool_registry=tool_registry,
             state=agent_state,
             max_iterations=input_data.max_iterations,
-            verbose=False  # Will be controlled by CLI verbose flag
+            verbose=False,  # Will be controlled by CLI verbose flag
+            on_iteration=on_iteration,
         )
         
         # Create initial prompt
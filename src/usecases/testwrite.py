@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, Field
 
 from core.blacklist import Blacklist
-from core.context import ContextCaps, collect_paths
+from core.context import ContextCaps, collect_paths, read_texts
 from core.models import SourceRef, UsecaseInput, UsecaseOutput
 from core.sandbox import SandboxMode
 from usecases.ask import usecase
 
+if TYPE_CHECKING:
+    from llm.provider import Provider
+
 
 class ProposedFile(BaseModel):
     path: str = Field(description="Relative path to the file")
@@ -46,7 +49,7 @@ class TestWrite:
     OutputModel = TestWriteOutput
 
     @staticmethod
-    def execute(input_data: TestWriteInput, provider, project_root: Path) -> TestWriteOutput:
+    def execute(input_data: TestWriteInput, provider: Provider, project_root: Path) -> TestWriteOutput:
         context_text = ""
         sources = []
         
@@ -77,14 +80,15 @@ class TestWrite:
         
         # Build context text and sources
         context_parts = []
-        for path in result.included:
+        for path, content in zip(result.included, read_texts(result.included)):
+            if content is None:
+                continue
             try:
-                content = path.read_text(encoding="utf-8")
                 rel_path = path.relative_to(project_root)
-                context_parts.append(f"=== {rel_path} ===\n{content}\n")
-                sources.append(SourceRef(path=str(rel_path), bytes=len(content.encode())))
-            except Exception:
+            except ValueError:
                 continue
+            context_parts.append(f"=== {rel_path} ===\n{content}\n")
+            sources.append(SourceRef(path=str(rel_path), bytes=len(content.encode())))
         
         if context_parts:
             context_text = "\n".join(context_parts)
@@ -57,7 +57,9 @@ class Renderer:
         self.console.print(Panel(table, border_style="grey39", expand=False))
 
     def render_text_block(self, content: str) -> None:
-        self.console.print(content)
+        # Model output is plain text: brackets in it are not Rich markup, and
+        # highlighting would only re-scan every line with regexes
+        self.console.print(content, markup=False, highlight=False)
 
     def render_plan(self, plan: list, risks: list[str], assumptions: list[str], next_actions: list[str]) -> None:
         """Render a structured task plan with numbered steps."""
@@ -121,7 +123,7 @@ class Renderer:
                     
                     self.console.print(f"   [dim]Preview ({len(lines)} lines):[/dim]")
                     for line in preview_lines:
-                        self.console.print(f"   [dim]  {line}[/dim]")
+                        self.console.print(Text(f"     {line}", style="dim"))
                     
                     if len(lines) > 10:
                         self.console.print(f"   [dim]  ... ({len(lines) - 10} more lines)[/dim]")
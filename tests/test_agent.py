@@ -1,14 +1,17 @@
 """Tests for the agent system."""
 
+import asyncio
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from pathlib import Path
 
 from agent import (
     AgentEngine, AgentResult, AgentState, Message, TodoState,
-    ToolCallingProvider, MockToolCallingProvider, AgentResponse
+    ToolCallingProvider, MockToolCallingProvider, AgentResponse,
+    AsyncOpenAIToolCallingProvider, OpenAIToolCallingProvider, ResponseCache, run_many
 )
-from tools import ToolRegistry, TodoList
+from tools import ToolRegistry, TodoList, ReadFileTool, TodoViewTool, TodoAddTool
 from tools.base import Tool, ToolResult
 
 
@@ -64,6 +67,11 @@ class TestMessage:
         msg = Message(role="tool", content="Result", tool_call_id="call_1")
         result = msg.to_dict()
         assert result["tool_call_id"] == "call_1"
+    
+    def test_message_to_dict_is_cached(self):
+        msg = Message(role="user", content="Test")
+        assert msg.to_dict() is msg.to_dict()
+        assert msg == Message(role="user", content="Test")
 
 
 class TestTodoState:
@@ -107,6 +115,18 @@ class TestAgentState:
         assert state.messages[1].role == "assistant"
         assert state.messages[2].role == "tool"
     
+    def test_get_last_assistant_message(self):
+        state = AgentState()
+        assert state.get_last_assistant_message() is None
+        
+        state.add_user_message("Hello")
+        state.add_assistant_message("First")
+        state.add_tool_message("Tool result", "call_1")
+        state.add_assistant_message("Second")
+        state.add_tool_message("Tool result", "call_2")
+        
+        assert state.get_last_assistant_message().content == "Second"
+    
     def test_get_conversation_for_api(self):
         state = AgentState()
         state.add_user_message("Test")
@@ -132,8 +152,7 @@ class TestAgentState:
         state.add_explored_file(file1)
         state.add_explored_file(file2)
         
-        assert file1 in state.files_explored
-        assert file2 in state.files_explored
+        assert state.files_explored == {"test1.py", "test2.py"}
         summary = state.get_exploration_summary()
         assert "2 files" in summary
     
@@ -181,6 +200,21 @@ class TestMockToolCallingProvider:
         assert result2.should_continue is False
 
 
+class TestOpenAIToolCallingProvider:
+    """Test OpenAI tool calling provider helpers."""
+    
+    def test_should_continue_signals(self):
+        provider = OpenAIToolCallingProvider(client=object())
+        
+        assert provider._should_continue_based_on_response("Whatever", [{"id": "call_1"}]) is True
+        assert provider._should_continue_based_on_response("Let me check the tests", []) is True
+        assert provider._should_continue_based_on_response("NEXT I will read it", []) is True
+        # Stop signals are substring matches and win over continue signals
+        assert provider._should_continue_based_on_response("Let me say: Task Completed", []) is False
+        assert provider._should_continue_based_on_response("The plan is completely ready", []) is False
+        assert provider._should_continue_based_on_response("Here is the plan", []) is False
+
+
 class TestAgentEngine:
     """Test AgentEngine class."""
     
@@ -247,6 +281,19 @@ class TestAgentEngine:
         assert len(tool_messages) > 0
         assert "Test result: hello" in tool_messages[0].content
     
+    def test_agent_on_iteration_callback(self, basic_setup):
+        registry, provider, state = basic_setup
+        seen = []
+        
+        engine = AgentEngine(
+            provider, registry, state, max_iterations=5,
+            on_iteration=lambda s: seen.append((s.iteration_count, len(s.messages))),
+        )
+        engine.run("Test prompt")
+        
+        # Called once per iteration, after that iteration's tool results were added
+        assert seen == [(1, 3), (2, 4)]
+    
     def test_agent_max_iterations_limit(self):
         # Create a provider that never stops
         provider = MockToolCallingProvider([
@@ -357,6 +404,357 @@ class TestAgentEngine:
         assert "Provider error" in result.error
 
 
+class TestAsyncAgent:
+    """Test the async execution path."""
+    
+    @staticmethod
+    def _make_engine():
+        registry = ToolRegistry()
+        registry.register(MockTestTool())
+        provider = MockToolCallingProvider([
+            AgentResponse(
+                message="Using tool",
+                tool_calls=[{
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "test_tool", "arguments": '{"action": "hi"}'}
+                }],
+                should_continue=True
+            ),
+            AgentResponse(message="Task completed", tool_calls=[], should_continue=False)
+        ])
+        return AgentEngine(provider, registry, AgentState(), max_iterations=5)
+    
+    def test_arun_matches_run(self):
+        sync_result = self._make_engine().run("Test prompt")
+        async_result = asyncio.run(self._make_engine().arun("Test prompt"))
+        
+        assert async_result.success is True
+        assert async_result.iterations_used == sync_result.iterations_used
+        assert [m.content for m in async_result.state.messages] == [m.content for m in sync_result.state.messages]
+    
+    def test_run_many_preserves_order_and_limits_concurrency(self):
+        in_flight = 0
+        peak = 0
+        
+        class SlowProvider(ToolCallingProvider):
+            async def agenerate_with_tools(self, messages, tools, max_tool_calls=5):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return AgentResponse(message=f"Done: {messages[0].content}", tool_calls=[], should_continue=False)
+        
+        prompts = [f"prompt {i}" for i in range(6)]
+        results = asyncio.run(run_many(
+            lambda: AgentEngine(SlowProvider(), ToolRegistry()), prompts, max_concurrency=2
+        ))
+        
+        assert [r.final_output["agent_summary"] for r in results] == [f"Done: {p}" for p in prompts]
+        assert peak == 2
+    
+    def test_conflicting_tool_calls_keep_emission_order(self):
+        import time
+        events = []
+        
+        class RecordingTool(MockTestTool):
+            def __init__(self, name, reads, writes, delay):
+                self._name, self.reads, self.writes, self._delay = name, reads, writes, delay
+            
+            @property
+            def name(self):
+                return self._name
+            
+            def execute(self, **kwargs):
+                events.append(("start", self._name))
+                time.sleep(self._delay)
+                events.append(("end", self._name))
+                return ToolResult(success=True, data=self._name)
+        
+        registry = ToolRegistry()
+        registry.register(RecordingTool("write_x", frozenset({"x"}), frozenset({"x"}), 0.05))
+        registry.register(RecordingTool("read_x", frozenset({"x"}), frozenset(), 0.0))
+        registry.register(RecordingTool("read_y", frozenset({"y"}), frozenset(), 0.0))
+        engine = AgentEngine(MockToolCallingProvider(), registry)
+        
+        calls = [
+            {"id": name, "type": "function", "function": {"name": name, "arguments": "{}"}}
+            for name in ["write_x", "read_x", "read_y"]
+        ]
+        asyncio.run(engine._aexecute_tool_calls(calls))
+        
+        # read_x waits for write_x; read_y doesn't conflict and runs alongside it
+        assert events.index(("start", "read_x")) > events.index(("end", "write_x"))
+        assert events.index(("end", "read_y")) < events.index(("end", "write_x"))
+        assert [m.content for m in engine.state.messages] == ["write_x", "read_x", "read_y"]
+    
+    def test_streamed_tool_calls_start_before_response_ends(self):
+        events = []
+        
+        def chunk(content=None, tool_calls=None):
+            delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+            return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+        
+        def tc_delta(index, id=None, name=None, arguments=None):
+            return SimpleNamespace(index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments))
+        
+        async def stream():
+            yield chunk(content="Let me look")
+            yield chunk(tool_calls=[tc_delta(0, id="call_0", name="test_tool", arguments='{"action"')])
+            yield chunk(tool_calls=[tc_delta(0, arguments=': "a"}')])
+            events.append("second call streaming")
+            yield chunk(tool_calls=[tc_delta(1, id="call_1", name="test_tool", arguments='{"action": "b"}')])
+            events.append("stream finished")
+        
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            return stream()
+        
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        provider = AsyncOpenAIToolCallingProvider(client=client)
+        
+        def on_tool_call(tool_call):
+            events.append(f"reported {tool_call['id']}")
+        
+        response = asyncio.run(provider.agenerate_with_tools([], [], on_tool_call=on_tool_call))
+        
+        # call_0 is reported as soon as its arguments close, before call_1 arrives
+        assert events == [
+            "reported call_0",
+            "second call streaming",
+            "reported call_1",
+            "stream finished",
+        ]
+        assert response.message == "Let me look"
+        assert [tc["function"]["arguments"] for tc in response.tool_calls] == ['{"action": "a"}', '{"action": "b"}']
+        assert response.should_continue is True
+    
+    def test_arun_records_parallel_results_in_emission_order(self):
+        import time
+        
+        class SleepTool(MockTestTool):
+            reads = frozenset({"sleep"})
+            writes = frozenset()
+            
+            def execute(self, **kwargs):
+                time.sleep(kwargs["delay"])
+                return ToolResult(success=True, data=f"slept {kwargs['delay']}")
+        
+        registry = ToolRegistry()
+        registry.register(SleepTool())
+        calls = [
+            {"id": f"call_{i}", "type": "function",
+             "function": {"name": "test_tool", "arguments": f'{{"delay": {delay}}}'}}
+            for i, delay in enumerate([0.05, 0.0])
+        ]
+        provider = MockToolCallingProvider([
+            AgentResponse(message="Sleeping", tool_calls=calls, should_continue=True),
+            AgentResponse(message="Task completed", tool_calls=[], should_continue=False)
+        ])
+        
+        result = asyncio.run(AgentEngine(provider, registry).arun("Sleep"))
+        
+        tool_messages = [m for m in result.state.messages if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1"]
+        assert [m.content for m in tool_messages] == ["slept 0.05", "slept 0.0"]
+    
+    def test_arun_with_streaming_provider_runs_each_call_once(self):
+        registry = ToolRegistry()
+        registry.register(MockTestTool())
+        turns = iter([
+            [SimpleNamespace(index=0, id="call_0", function=SimpleNamespace(name="test_tool", arguments='{"action": "hi"}'))],
+            None,
+        ])
+        
+        async def create(**kwargs):
+            tool_calls = next(turns)
+            content = "Let me check" if tool_calls else "Task completed"
+            
+            async def stream():
+                delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+            return stream()
+        
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        engine = AgentEngine(AsyncOpenAIToolCallingProvider(client=client), registry)
+        result = asyncio.run(engine.arun("Go"))
+        
+        tool_messages = [m for m in result.state.messages if m.role == "tool"]
+        assert [m.content for m in tool_messages] == ["Test result: hi"]
+        assert result.iterations_used == 2
+    
+    def test_arun_records_calls_run_before_stream_failed(self):
+        registry = ToolRegistry()
+        registry.register(MockTestTool())
+        
+        async def create(**kwargs):
+            async def stream():
+                delta = SimpleNamespace(content=None, tool_calls=[
+                    SimpleNamespace(index=0, id="call_0", function=SimpleNamespace(name="test_tool", arguments='{"action": "a"}'))
+                ])
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+                delta = SimpleNamespace(content=None, tool_calls=[
+                    SimpleNamespace(index=1, id="call_1", function=SimpleNamespace(name="test_tool", arguments="{"))
+                ])
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+                raise RuntimeError("connection reset")
+            return stream()
+        
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        result = asyncio.run(AgentEngine(AsyncOpenAIToolCallingProvider(client=client), registry).arun("Go"))
+        
+        messages = result.state.messages
+        assert [m.role for m in messages] == ["user", "assistant", "tool", "assistant"]
+        assert messages[1].tool_calls[0]["id"] == "call_0"
+        assert (messages[2].tool_call_id, messages[2].content) == ("call_0", "Test result: a")
+        assert messages[3].content == "Error: connection reset"
+    
+    def test_arun_records_calls_run_before_provider_raised(self):
+        registry = ToolRegistry()
+        registry.register(MockTestTool())
+        tool_call = {"id": "call_0", "type": "function",
+                     "function": {"name": "test_tool", "arguments": '{"action": "a"}'}}
+        
+        class FailingProvider(AsyncOpenAIToolCallingProvider):
+            async def agenerate_with_tools(self, messages, tools, max_tool_calls=5, on_tool_call=None):
+                on_tool_call(tool_call)
+                raise RuntimeError("boom")
+        
+        provider = FailingProvider(client=SimpleNamespace())
+        result = asyncio.run(AgentEngine(provider, registry).arun("Go"))
+        
+        assert result.success is False
+        tool_messages = [m for m in result.state.messages if m.role == "tool"]
+        assert [m.content for m in tool_messages] == ["Test result: a"]
+    
+    def test_async_openai_provider(self):
+        tool_call = SimpleNamespace(
+            id="call_1", type="function",
+            function=SimpleNamespace(name="test_tool", arguments="{}")
+        )
+        completion = SimpleNamespace(choices=[
+            SimpleNamespace(message=SimpleNamespace(content="Let me look", tool_calls=[tool_call]))
+        ])
+        
+        async def create(**kwargs):
+            return completion
+        
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        provider = AsyncOpenAIToolCallingProvider(client=client)
+        response = asyncio.run(provider.agenerate_with_tools([Message(role="user", content="hi")], []))
+        
+        assert response.tool_calls[0]["function"]["name"] == "test_tool"
+        assert response.should_continue is True
+        with pytest.raises(NotImplementedError):
+            provider.generate_with_tools([], [])
+
+
+class TestResponseCache:
+    """Test caching of tool-calling responses."""
+    
+    @staticmethod
+    def _client(calls):
+        def create(**kwargs):
+            calls.append(kwargs)
+            if kwargs["messages"][-1]["content"] == "fail":
+                raise RuntimeError("boom")
+            message = SimpleNamespace(content=f"Answer {len(calls)}", tool_calls=None)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    
+    def test_identical_requests_hit_cache(self):
+        calls = []
+        provider = OpenAIToolCallingProvider(client=self._client(calls), cache=ResponseCache())
+        messages = [Message(role="user", content="hi")]
+        
+        first = provider.generate_with_tools(messages, [])
+        second = provider.generate_with_tools(messages, [])
+        provider.generate_with_tools([Message(role="user", content="other")], [])
+        
+        assert len(calls) == 2
+        assert second.message == first.message == "Answer 1"
+        assert second.raw_response is None
+        assert (provider.cache.hits, provider.cache.misses) == (1, 2)
+    
+    def test_errors_are_not_cached(self):
+        calls = []
+        provider = OpenAIToolCallingProvider(client=self._client(calls), cache=ResponseCache())
+        messages = [Message(role="user", content="fail")]
+        
+        assert provider.generate_with_tools(messages, []).message == "Error: boom"
+        provider.generate_with_tools(messages, [])
+        
+        assert len(calls) == 2
+        assert len(provider.cache) == 0
+    
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2)
+        for key in ("a", "b"):
+            cache.put(key, AgentResponse(message=key, tool_calls=[]))
+        cache.get("a")
+        cache.put("c", AgentResponse(message="c", tool_calls=[]))
+        
+        assert cache.get("b") is None
+        assert cache.get("a").message == "a"
+    
+    def test_persisted_across_instances(self, tmp_path):
+        path = tmp_path / "responses"
+        ResponseCache(path=path).put("k", AgentResponse(message="saved", tool_calls=[]))
+        
+        assert ResponseCache(path=path).get("k").message == "saved"
+    
+    def test_missing_persisted_file_is_a_miss(self, tmp_path):
+        cache = ResponseCache(path=tmp_path / "not-created" / "responses")
+        
+        assert cache.get("k") is None
+        assert not (tmp_path / "not-created").exists()
+    
+    def test_persisted_entries_are_capped(self, tmp_path):
+        path = tmp_path / "responses"
+        for key in ("a", "b", "c"):
+            ResponseCache(maxsize=2, path=path).put(key, AgentResponse(message=key, tool_calls=[]))
+        
+        fresh = ResponseCache(maxsize=2, path=path)
+        assert fresh.get("a") is None
+        assert fresh.get("c").message == "c"
+    
+    def test_expired_entries_are_misses(self, tmp_path):
+        path = tmp_path / "responses"
+        cache = ResponseCache(path=path, ttl=-1)
+        cache.put("k", AgentResponse(message="old", tool_calls=[]))
+        
+        assert cache.get("k") is None
+        assert ResponseCache(path=path, ttl=-1).get("k") is None
+    
+    def test_unreadable_persisted_file_is_a_miss(self, tmp_path):
+        path = tmp_path / "responses"
+        path.write_bytes(b"not a database")
+        
+        assert ResponseCache(path=path).get("k") is None
+    
+    def test_stale_persisted_entry_is_a_miss(self, tmp_path):
+        import sqlite3
+        
+        path = tmp_path / "responses"
+        ResponseCache(path=path).put("k", AgentResponse(message="saved", tool_calls=[]))
+        with sqlite3.connect(path) as db:
+            db.execute("UPDATE responses SET response = ?", (b"garbage",))
+        
+        assert ResponseCache(path=path).get("k") is None
+
+    def test_key_depends_on_tool_schemas(self):
+        cache = ResponseCache()
+        tools = [ReadFileTool(Path(".")).get_function_schema()]
+        params = {"model": "m", "messages": [], "tools": tools}
+
+        assert cache.key(params) == cache.key(params)
+        assert cache.key(params) == ResponseCache().key({**params, "tools": list(tools)})
+        assert cache.key(params) != cache.key({**params, "tools": [TodoViewTool(TodoList()).get_function_schema()]})
+        assert cache.key(params) != cache.key({"model": "m", "messages": []})
+
+
 class TestAgentResult:
     """Test AgentResult class."""
     
@@ -392,3 +790,18 @@ class TestAgentResult:
         assert "Failed after 2 iterations" in summary
         assert "Something went wrong" in summary
 
+
+
+class TestLazyExports:
+    """Test the lazy re-exports of the agent package."""
+    
+    def test_all_exports_resolve(self):
+        import agent
+        for name in agent.__all__:
+            assert getattr(agent, name) is not None
+        assert agent.AgentEngine is AgentEngine
+    
+    def test_unknown_attribute_raises(self):
+        import agent
+        with pytest.raises(AttributeError):
+            agent.DoesNotExist
@@ -283,6 +283,28 @@ class TestAgenticTask:
         assert "failed" in result.plan.lower()
         assert "Provider failure" in result.agent_reasoning
     
+    def test_structured_provider_client_is_reused(self, temp_project):
+        """Test that a non tool-calling provider's client is shared with the agent."""
+        input_data = AgenticTaskInput(objective="Reuse client", max_iterations=5)
+        structured_provider = Mock(spec=["client", "generate_structured"])
+        
+        with patch("usecases.agentic_task.OpenAIToolCallingProvider") as tool_provider_cls:
+            tool_provider_cls.return_value = MockToolCallingProvider()
+            AgenticTask.execute(input_data, structured_provider, temp_project)
+        
+        assert tool_provider_cls.call_args.kwargs["client"] is structured_provider.client
+    
+    def test_structured_provider_cache_is_shared(self, temp_project):
+        """Test that the agent replays through the structured provider's cache."""
+        input_data = AgenticTaskInput(objective="Share cache", max_iterations=5)
+        structured_provider = Mock(spec=["client", "cache", "generate_structured"])
+        
+        with patch("usecases.agentic_task.OpenAIToolCallingProvider") as tool_provider_cls:
+            tool_provider_cls.return_value = MockToolCallingProvider()
+            AgenticTask.execute(input_data, structured_provider, temp_project)
+        
+        assert tool_provider_cls.call_args.kwargs["cache"] is structured_provider.cache
+    
     def test_setup_agent_components(self, temp_project):
         """Test the setup of agent components."""
         input_data = AgenticTaskInput(objective="Test setup")
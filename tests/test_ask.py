@@ -57,3 +57,35 @@ def test_ask_with_context(tmp_path: Path):
     prompt = call_args.kwargs["prompt"]
     assert "Test Project" in prompt
     assert "This is a test." in prompt
+
+
+def test_ask_cache_flag_keeps_default_temperature(tmp_path: Path, monkeypatch):
+    """--cache replays answers without forcing a temperature the model may reject."""
+    from types import SimpleNamespace
+    from typer.testing import CliRunner
+
+    from agent.cache import ResponseCache
+    from cli import build_app
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(parsed=None, content='{"answer": "Cached answer", "sources": []}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    cache = ResponseCache()
+    monkeypatch.setattr("cli_commands.ask.get_openai_client", lambda: client)
+    monkeypatch.setattr("cli_commands.ask.get_response_cache", lambda: cache)
+    monkeypatch.chdir(tmp_path)
+
+    argv = ["ai", "ask", "What is this?", "--cache"]
+    for _ in range(2):
+        result = CliRunner().invoke(build_app(argv), argv[1:])
+        assert result.exit_code == 0, result.output
+
+    assert len(calls) == 1
+    assert calls[0]["model"] == "gpt-5-mini"
+    assert "temperature" not in calls[0]
+    assert cache.hits == 1
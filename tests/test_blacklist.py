@@ -3,7 +3,7 @@
 from pathlib import Path
 import pytest
 
-from core.blacklist import Blacklist, DEFAULT_BLACKLIST
+from core.blacklist import Blacklist, DEFAULT_BLACKLIST, compile_patterns
 
 
 def test_default_blacklist_patterns():
@@ -115,3 +115,36 @@ def test_custom_patterns():
     # Default patterns should not be active
     assert not blacklist.is_blocked(Path(".git/config"))
     assert not blacklist.is_blocked(Path("image.png"))
+
+
+def test_compile_patterns():
+    """Test that patterns compile into a single regex with blacklist semantics."""
+    assert compile_patterns([]) is None
+    
+    compiled = compile_patterns(["c++/", "*.log"])
+    assert compiled.match("c++")
+    assert compiled.match("c++/main.cpp")
+    assert not compiled.match("c++x/main.cpp")
+    assert compiled.match("logs/app.log")
+    assert not compiled.match("app.log.txt")
+
+
+def test_blacklist_prunes_only_directory_patterns():
+    """Test which directories a walk may skip entirely."""
+    blacklist = Blacklist()
+    
+    assert blacklist.prunes(Path(".git"))
+    assert blacklist.prunes(Path("node_modules"))
+    assert not blacklist.prunes(Path("src"))
+    # File patterns can match a directory name without covering its contents
+    assert not blacklist.prunes(Path("assets.zip"))
+    # An ignore could re-allow something inside, so nothing is pruned
+    assert not Blacklist(extra_ignores=["*.md"]).prunes(Path(".git"))
+
+
+def test_blacklist_accepts_string_paths():
+    """Test that posix-style strings match the same as Path objects."""
+    blacklist = Blacklist()
+    
+    for rel in (".git/config", "src/.env", "src/main.py", "docs/logo.png"):
+        assert blacklist.is_blocked(rel) == blacklist.is_blocked(Path(rel))
@@ -3,7 +3,7 @@
 from pathlib import Path
 import pytest
 
-from core.context import collect_paths, ContextCaps, looks_binary, TEXT_EXTENSIONS
+from core.context import collect_paths, ContextCaps, looks_binary, read_texts, TEXT_EXTENSIONS
 from core.blacklist import Blacklist
 
 
@@ -42,6 +42,17 @@ def test_looks_binary_with_actual_content(tmp_path: Path):
     assert looks_binary(binary_file)
 
 
+def test_looks_binary_trusts_known_extensions(tmp_path: Path):
+    """Test that known binary extensions are rejected without reading the file."""
+    image = tmp_path / "image.PNG"
+    image.write_text("no null bytes here")
+    assert looks_binary(image)
+    
+    unknown = tmp_path / "notes.rst"
+    unknown.write_text("plain text")
+    assert not looks_binary(unknown)
+
+
 def test_collect_paths_basic(tmp_path: Path):
     """Test basic path collection."""
     # Create test files
@@ -79,7 +90,30 @@ def test_collect_paths_with_blacklist(tmp_path: Path):
     
     assert good_file in result.included
     assert bad_file in result.skipped  # Blocked by blacklist
-    assert vcs_file in result.skipped  # Blocked by blacklist
+    assert vcs_dir in result.skipped  # Blocked directory is pruned as a whole
+    assert vcs_file not in result.included
+
+
+def test_collect_paths_keeps_walking_non_pruned_dirs(tmp_path: Path):
+    """Test that only directory patterns prune, and ignores disable pruning."""
+    nested = tmp_path / "src" / "node_modules"
+    nested.mkdir(parents=True)
+    (nested / "lib.js").write_text("x")
+    deps = tmp_path / "node_modules"
+    deps.mkdir()
+    kept = deps / "keep.js"
+    kept.write_text("x")
+    
+    result = collect_paths([tmp_path], Blacklist())
+    
+    # Directory patterns apply relative to the root, as in Blacklist.is_blocked
+    assert nested / "lib.js" in result.included
+    assert deps in result.skipped
+    
+    blacklist = Blacklist(extra_ignores=["node_modules/keep.js"])
+    result = collect_paths([tmp_path], blacklist)
+    
+    assert kept in result.included
 
 
 def test_collect_paths_with_caps(tmp_path: Path):
@@ -121,6 +155,23 @@ def test_collect_paths_max_files_limit(tmp_path: Path):
     assert len(result.skipped) == 2
 
 
+def test_collect_paths_lists_files_past_cap_in_later_roots(tmp_path: Path):
+    """Test that files left out by max_files are still reported as skipped."""
+    first = tmp_path / "a.py"
+    first.write_text("a = 1")
+    later = tmp_path / "later"
+    later.mkdir()
+    later_files = [later / f"b{i}.py" for i in range(3)]
+    for f in later_files:
+        f.write_text("b = 1")
+    
+    caps = ContextCaps(max_files=1)
+    result = collect_paths([first, later], Blacklist(patterns=[]), caps)
+    
+    assert result.included == [first]
+    assert sorted(result.skipped) == later_files
+
+
 def test_collect_paths_total_bytes_limit(tmp_path: Path):
     """Test total bytes limit."""
     # Create files that exceed total limit when combined
@@ -180,3 +231,19 @@ def test_collect_paths_binary_files_skipped(tmp_path: Path):
     
     assert text_file in result.included
     assert binary_file in result.skipped  # Binary files skipped
+
+
+def test_read_texts_keeps_order_and_marks_failures(tmp_path: Path):
+    """Test that files are read in input order, with None for unreadable ones."""
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text(f"content {i}")
+        paths.append(path)
+    missing = tmp_path / "missing.txt"
+    
+    contents = read_texts(paths[:5] + [missing] + paths[5:])
+    
+    assert contents[5] is None
+    assert contents[:5] + contents[6:] == [f"content {i}" for i in range(10)]
+    assert read_texts([]) == []
@@ -0,0 +1,110 @@
+"""Tests for the daemon server and the forwarding client."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_cli_daemon.client import control, forward
+from ai_cli_daemon.protocol import NO_DAEMON_ENV
+
+SRC_ROOT = Path(__file__).resolve().parent.parent / "src"
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    return tmp_path / "ai-cli" / "sock"
+
+
+@pytest.fixture
+def daemon(tmp_path, sock_path, monkeypatch):
+    """Run a daemon in a subprocess, listening on a socket under tmp_path."""
+    monkeypatch.delenv(NO_DAEMON_ENV, raising=False)
+    env = dict(os.environ, XDG_CACHE_HOME=str(tmp_path), PYTHONPATH=str(SRC_ROOT))
+    proc = subprocess.Popen([sys.executable, "-m", "ai_cli_daemon.server"], env=env)
+    deadline = time.monotonic() + 30
+    while control("status", sock_path) is None:
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            pytest.fail("daemon did not start")
+        time.sleep(0.05)
+    yield proc
+    control("stop", sock_path)
+    proc.wait(timeout=10)
+
+
+def test_no_daemon_falls_back(sock_path):
+    """Without a listening socket the client defers to in-process execution."""
+    assert forward(["ai", "ask", "--help"], sock_path) is None
+    assert control("status", sock_path) is None
+
+
+def test_stale_socket_falls_back(sock_path):
+    """A socket file nobody listens on is treated as no daemon."""
+    sock_path.parent.mkdir(parents=True)
+    sock_path.touch()
+    assert forward(["ai", "ask", "--help"], sock_path) is None
+
+
+def test_status(daemon, sock_path):
+    info = control("status", sock_path)
+    assert info["status"] == "running"
+    assert info["pid"] == daemon.pid
+    assert info["requests"] == 0
+
+
+def test_forward_streams_output(daemon, sock_path, capsys):
+    exit_code = forward(["ai", "task", "--help"], sock_path)
+    assert exit_code == 0
+    assert "--risk-level" in capsys.readouterr().out
+    assert control("status", sock_path)["requests"] == 1
+
+
+def test_forward_propagates_exit_code(daemon, sock_path, capsys):
+    exit_code = forward(["ai", "no-such-command"], sock_path)
+    assert exit_code == 2
+    assert "No such command" in capsys.readouterr().err
+
+
+def test_run_command_restores_process_state(tmp_path):
+    """Each request borrows cwd/env/streams and hands them back afterwards."""
+    from ai_cli_daemon.server import run_command
+
+    cwd, env, stdout = os.getcwd(), dict(os.environ), sys.stdout
+    messages = []
+    exit_code = run_command(["ai", "task", "--help"], str(tmp_path), {"COLUMNS": "200"}, messages.append)
+    assert exit_code == 0
+    assert any("--risk-level" in m.get("stdout", "") for m in messages)
+    assert os.getcwd() == cwd
+    assert dict(os.environ) == env
+    assert sys.stdout is stdout
+
+
+def test_socket_is_private(daemon, sock_path):
+    assert sock_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_prompts_read_client_stdin(monkeypatch, capsys):
+    """input() inside a forwarded command pulls lines from the client."""
+    from ai_cli_daemon.server import _StdinReader
+
+    lines = iter(["y\n"])
+    monkeypatch.setattr(sys, "stdin", _StdinReader(lambda: next(lines, "")))
+    assert input("Write files? ") == "y"
+    with pytest.raises(EOFError):
+        input()
+    assert "Write files?" in capsys.readouterr().out
+
+
+def test_opt_out(daemon, sock_path, monkeypatch):
+    monkeypatch.setenv(NO_DAEMON_ENV, "1")
+    assert forward(["ai", "task", "--help"], sock_path) is None
+
+
+def test_stop_removes_socket(daemon, sock_path):
+    assert control("stop", sock_path)["status"] == "stopping"
+    daemon.wait(timeout=10)
+    assert not sock_path.exists()
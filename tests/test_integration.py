@@ -32,6 +32,13 @@ def test_cli_help():
     assert "testwrite     Generate comprehensive test suites for your code" in result.stdout
 
 
+def test_cli_version():
+    """Test that --version prints the version and exits cleanly."""
+    result = run_ai_command(["--version"])
+    assert result.returncode == 0
+    assert result.stdout.strip() == "0.1.0"
+
+
 def test_ask_command_help():
     """Test ask command help."""
     result = run_ai_command(["ask", "--help"])
@@ -22,3 +22,40 @@ def test_fake_provider_roundtrip():
     assert result.output.text == "hello"
     assert result.model == "fake"
     assert "prompt" in result.raw
+
+
+def test_openai_provider_reuses_json_schema():
+    from llm.openai_provider import _json_schema
+
+    assert _json_schema(Answer) is _json_schema(Answer)
+    assert _json_schema(Answer) == Answer.model_json_schema()
+
+
+def test_openai_provider_replays_cached_response(tmp_path):
+    from types import SimpleNamespace
+
+    from agent.cache import ResponseCache
+    from llm.openai_provider import OpenAIProvider
+
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(parsed=None, content=f'{{"text": "answer {len(calls)}"}}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    path = tmp_path / "responses"
+    provider = OpenAIProvider(client, model="m", cache=ResponseCache(path=path))
+
+    first = provider.generate_structured(prompt="hi", response_model=Answer)
+    second = provider.generate_structured_streaming(prompt="hi", response_model=Answer)
+    other = provider.generate_structured(prompt="bye", response_model=Answer)
+
+    assert first.output.text == second.output.text == "answer 1"
+    assert other.output.text == "answer 2"
+    assert len(calls) == 2
+    # A fresh process sees the persisted answer
+    replayed = OpenAIProvider(client, model="m", cache=ResponseCache(path=path))
+    assert replayed.generate_structured(prompt="hi", response_model=Answer).output.text == "answer 1"
+    assert len(calls) == 2
@@ -86,6 +86,15 @@ def test_render_text_block():
     assert content in output
 
 
+def test_render_text_block_keeps_brackets():
+    """Test that brackets in model output are printed, not parsed as markup."""
+    content = "Use list[int] here, and [bold]this[/bold] is literal."
+    
+    output = capture_render_output(lambda r: r.render_text_block(content))
+    
+    assert content in output
+
+
 def test_render_plan():
     """Test structured plan rendering."""
     steps = [
@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch
 from tools import (
     Tool, ToolResult, ToolRegistry,
     TreeTool, ReadFileTool,
-    TodoList, TodoViewTool, TodoEditTool, TodoAddTool
+    TodoList, TodoItem, TodoViewTool, TodoEditTool, TodoAddTool
 )
 from core.blacklist import Blacklist
 
@@ -63,6 +63,26 @@ class MockTool(Tool):
         return ToolResult(success=True, data=f"Mock result: {kwargs}")
 
 
+class TestToolConflicts:
+    """Test resource-based conflict detection between tools."""
+    
+    def test_readers_do_not_conflict(self, tmp_path):
+        todo_list = TodoList()
+        assert not ReadFileTool(tmp_path).conflicts_with(TreeTool(tmp_path))
+        assert not TodoViewTool(todo_list).conflicts_with(ReadFileTool(tmp_path))
+    
+    def test_writer_conflicts_with_readers_and_writers(self):
+        todo_list = TodoList()
+        add = TodoAddTool(todo_list)
+        assert add.conflicts_with(TodoViewTool(todo_list))
+        assert TodoViewTool(todo_list).conflicts_with(add)
+        assert add.conflicts_with(add)
+    
+    def test_undeclared_tool_conflicts_with_everything(self, tmp_path):
+        assert MockTool().conflicts_with(ReadFileTool(tmp_path))
+        assert ReadFileTool(tmp_path).conflicts_with(MockTool())
+
+
 class TestToolRegistry:
     """Test ToolRegistry class."""
     
@@ -127,6 +147,17 @@ class TestToolRegistry:
         assert schema["type"] == "function"
         assert schema["function"]["name"] == "mock_tool"
         assert "parameters" in schema["function"]
+    
+    def test_function_schemas_reset_on_register(self):
+        registry = ToolRegistry()
+        registry.register(MockTool())
+        
+        schemas = registry.get_function_schemas()
+        assert registry.get_function_schemas() is schemas
+        
+        registry.register(TodoViewTool(TodoList()))
+        
+        assert [s["function"]["name"] for s in registry.get_function_schemas()] == ["mock_tool", "todo_view"]
 
 
 class TestTreeTool:
@@ -322,6 +353,24 @@ class TestTodoList:
         assert "- [x] 1. First task" in markdown
         assert "- [ ] 2. Second task" in markdown
     
+    def test_to_markdown_tracks_mutations(self):
+        todo_list = TodoList()
+        todo_list.add("First task")
+        assert todo_list.to_markdown() == "- [ ] 1. First task"
+        
+        todo_list.edit(1, status=True)
+        assert todo_list.to_markdown() == "- [x] 1. First task"
+        
+        todo_list.add("Second task")
+        assert todo_list.to_markdown() == "- [x] 1. First task\n- [ ] 2. Second task"
+        
+        todo_list.clear()
+        assert todo_list.to_markdown() == "No todos yet."
+        
+        todo_list.add("Third task")
+        todo_list.get_item(1).completed = True
+        assert todo_list.to_markdown() == "- [x] 1. Third task"
+    
     def test_get_stats(self):
         todo_list = TodoList()
         todo_list.add("Task 1")
@@ -337,6 +386,30 @@ class TestTodoList:
             "completed_items": 2,
             "pending_items": 1
         }
+    
+    def test_get_stats_after_reopening(self):
+        todo_list = TodoList()
+        todo_list.add("Task 1")
+        todo_list.edit(1, status=True)
+        todo_list.edit(1, status=True)
+        todo_list.edit(1, status=False)
+        
+        assert todo_list.get_stats()["completed_items"] == 0
+    
+    def test_add_after_initial_items(self):
+        todo_list = TodoList(items=[TodoItem(1, "a"), TodoItem(2, "b")])
+        
+        assert todo_list.add("c") == 3
+        assert todo_list.get_item(1).text == "a"
+        assert todo_list.get_item(3).text == "c"
+    
+    def test_get_stats_sees_direct_item_changes(self):
+        todo_list = TodoList()
+        todo_list.add("a")
+        todo_list.add("b")
+        todo_list.get_item(1).completed = True
+        
+        assert todo_list.get_stats()["completed_items"] == 1
 
 
 class TestTodoTools: